@@ -59,9 +59,9 @@ class GPIOManager:
             f"🔌 GPIO INITIALIZED: Button={self.button_pin}, Relay={self.relay_pin}"
         )
 
-    def add_event_detect(self, callback):
+    def add_event_detect(self, callback, bouncetime_ms=200):
         GPIO.add_event_detect(
-            self.button_pin, GPIO.FALLING, callback=callback, bouncetime=200
+            self.button_pin, GPIO.FALLING, callback=callback, bouncetime=bouncetime_ms
         )
 
     def trigger_scare(self):
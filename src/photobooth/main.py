@@ -8,7 +8,7 @@ import time
 import platform
 
 from photobooth.managers.session_manager import SessionManager
-from photobooth.managers.camera_manager import CameraManager
+from photobooth.managers.camera_manager import CameraManager, ThreadedFrameSource
 from photobooth.hardware.gpio_manager import GPIOManager
 from photobooth.managers.audio_manager import AudioManager
 from photobooth.ui.overlay_renderer import OverlayRenderer
@@ -66,6 +66,8 @@ def main():
 
     # Initialize managers and UI components
     camera_manager = CameraManager(config)
+    # Grab frames on a background thread so capture overlaps overlay/display
+    frame_source = ThreadedFrameSource(camera_manager)
     settings_overlay = SettingsOverlay(3.0)
     camera_controls = CameraControls(
         DisplayManager, config.get("LIGHTING_CONFIG", {}), settings_overlay
@@ -95,11 +97,13 @@ def main():
         overlay_renderer,
         session_manager,
         keyboard_input_manager,
+        frame_source=frame_source,
     )
 
     import traceback
 
     try:
+        frame_source.start()
         display_manager.run()
     except KeyboardInterrupt:
         print("Interrupted by user. Exiting...")
@@ -109,6 +113,7 @@ def main():
         logging.exception("Unhandled exception in PhotoBooth main loop:")
         traceback.print_exc()
     finally:
+        frame_source.stop()
         try:
             display_manager.cleanup()
         except Exception as e:
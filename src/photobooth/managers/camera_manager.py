@@ -12,6 +12,7 @@ KEY METHODS:
 - get_frame(): Capture single frame with error recovery
 - release(): Clean shutdown of camera resources
 - set_camera_setting(): Adjust camera parameters (brightness, contrast, etc.)
+- ThreadedFrameSource: Background grab thread holding only the newest frame
 
 BACKEND SUPPORT:
 - Picamera2: Primary backend for Raspberry Pi cameras (IMX708 sensor)
@@ -28,6 +29,7 @@ import os
 import time
 import cv2
 import platform
+import threading
 
 try:
     from picamera2 import Picamera2
@@ -60,6 +62,17 @@ class CameraManager:
         self.test_video_path = config.get("TEST_VIDEO_PATH", 0)
         self.use_webcam = config.get("USE_WEBCAM", True)
         self.lighting_config = config.get("LIGHTING_CONFIG", {})
+        # Keep a single queued OpenCV frame (and MJPG over USB) so the
+        # preview is never several frames behind the button press
+        self.low_latency = config.get("CAM_LOW_LATENCY", True)
+        # Per-frame diagnostics; off by default since get_frame() runs every frame
+        self.debug_camera = config.get("DEBUG_ENABLED", False) or config.get(
+            "DEBUG_CAMERA", False
+        )
+        # Mirror in the sensor pipeline (Picamera2 only); `mirrored` reports
+        # whether it took effect so renderers can skip their own flip
+        self.hflip = config.get("CAM_HFLIP", False)
+        self.mirrored = False
         self.picam2 = None
         self.cap = None
         self.init_camera()
@@ -72,8 +85,16 @@ class CameraManager:
                 self.picam2 = Picamera2()
 
                 # Create configuration with RGB888 format (like Pi 2W)
+                extra = {}
+                if self.hflip:
+                    try:
+                        from libcamera import Transform
+
+                        extra["transform"] = Transform(hflip=1)
+                    except Exception as e:
+                        print(f"[WARN] Sensor hflip unavailable: {e}")
                 cam_config = self.picam2.create_preview_configuration(
-                    main={"size": self.cam_resolution, "format": "RGB888"}
+                    main={"size": self.cam_resolution, "format": "RGB888"}, **extra
                 )
                 print(f"[INFO] Picamera2 config: {cam_config}")
 
@@ -102,6 +123,7 @@ class CameraManager:
                 test_frame = self.picam2.capture_array()
                 if test_frame is not None:
                     print(f"[INFO] ✅ Picamera2 working! Frame: {test_frame.shape}")
+                    self.mirrored = "transform" in extra
                     return  # Success! Use Picamera2
                 else:
                     raise RuntimeError("Picamera2 started but can't capture frames")
@@ -124,14 +146,10 @@ class CameraManager:
             if self.cap.isOpened():
                 print(f"[INFO] Using V4L2 camera at /dev/video{src}")
                 # Configure V4L2 settings for better Pi camera performance
-                self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce latency
+                self._apply_low_latency()
                 self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.cam_resolution[0])
                 self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.cam_resolution[1])
                 self.cap.set(cv2.CAP_PROP_FPS, 15)  # Reasonable FPS for Pi
-                # Try MJPG format for better performance
-                self.cap.set(
-                    cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc("M", "J", "P", "G")
-                )
 
                 # Test if we can actually read frames
                 print("[INFO] Testing camera capture...")
@@ -150,10 +168,12 @@ class CameraManager:
                     )
                     self.cap.release()
                     self.cap = cv2.VideoCapture(src)  # Default backend
+                    self._apply_low_latency()
             else:
                 # Fallback to default backend
                 print("[WARN] V4L2 failed, trying default OpenCV backend")
                 self.cap = cv2.VideoCapture(src)
+                self._apply_low_latency()
 
             if not self.cap.isOpened():
                 raise RuntimeError(
@@ -170,9 +190,10 @@ class CameraManager:
                     frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
                 except Exception:
                     pass
-            print(
-                f"[DEBUG] CameraManager.get_frame (picam2): shape={getattr(frame, 'shape', None)}, dtype={getattr(frame, 'dtype', None)}"
-            )
+            if self.debug_camera:
+                print(
+                    f"[DEBUG] CameraManager.get_frame (picam2): shape={getattr(frame, 'shape', None)}, dtype={getattr(frame, 'dtype', None)}"
+                )
             return frame
         else:
             try:
@@ -186,6 +207,7 @@ class CameraManager:
                     pass
                 # attempt to reopen device/source
                 self.cap = cv2.VideoCapture(self.test_video_path)
+                self._apply_low_latency()
                 return None
 
             if not ok or frame is None:
@@ -196,13 +218,46 @@ class CameraManager:
                 except Exception:
                     pass
                 self.cap = cv2.VideoCapture(self.test_video_path)
+                self._apply_low_latency()
                 return None
 
-            print(
-                f"[DEBUG] CameraManager.get_frame (opencv): shape={getattr(frame, 'shape', None)}, dtype={getattr(frame, 'dtype', None)} min={getattr(frame, 'min', lambda: None)()} max={getattr(frame, 'max', lambda: None)()}"
-            )
+            if self.debug_camera:
+                # min()/max() scan the whole frame, so only pay for them here
+                print(
+                    f"[DEBUG] CameraManager.get_frame (opencv): shape={getattr(frame, 'shape', None)}, dtype={getattr(frame, 'dtype', None)} min={getattr(frame, 'min', lambda: None)()} max={getattr(frame, 'max', lambda: None)()}"
+                )
             return frame
 
+    def _apply_low_latency(self):
+        """
+        Shrink the OpenCV capture queue to one frame and request MJPG.
+
+        V4L2 drivers queue ~4 frames by default, so without this every
+        read() returns a frame that is already several frames old. Backends
+        that ignore BUFFERSIZE are still kept current by ThreadedFrameSource,
+        which grabs continuously and so drains the queue.
+        """
+        if not self.low_latency:
+            return
+        self.set_capture_property(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Try MJPG format for better performance (YUYV saturates USB 2.0)
+        self.set_capture_property(
+            cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc("M", "J", "P", "G")
+        )
+
+    def set_capture_property(self, prop, value):
+        """
+        Set an OpenCV capture property (e.g. cv2.CAP_PROP_BUFFERSIZE).
+
+        Returns True if the backend accepted it; always False on Picamera2.
+        """
+        if self.cap is None:
+            return False
+        try:
+            return bool(self.cap.set(prop, value))
+        except Exception:
+            return False
+
     def set_white_balance_mode(self, mode):
         """
         Set white balance mode for Picamera2
@@ -220,3 +275,67 @@ class CameraManager:
                 self.picam2.stop()
             except Exception:
                 pass
+
+
+class ThreadedFrameSource:
+    """
+    Runs CameraManager.get_frame() on a daemon thread.
+
+    Only the newest frame is kept (a single slot under a lock), so the
+    display loop never blocks on the camera transfer and never sees a
+    backlog of stale frames.
+    """
+
+    def __init__(self, camera_manager):
+        self.camera_manager = camera_manager
+        self._frame = None
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the grab thread (no-op if already running)."""
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ThreadedFrameSource", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def read(self):
+        """
+        Return (frame, seq) without blocking.
+
+        seq increases by one for every grabbed frame, so callers can tell a
+        new frame from the one they already rendered. frame is None until
+        the first grab succeeds.
+        """
+        with self._lock:
+            return self._frame, self._seq
+
+    def stop(self):
+        """Stop the grab thread and drop the held frame."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout=1.0)
+        self._thread = None
+        self._frame = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                frame = self.camera_manager.get_frame()
+            except Exception as e:
+                print(f"[WARN] ThreadedFrameSource: get_frame() raised: {e}")
+                frame = None
+            if frame is None:
+                time.sleep(0.005)
+                continue
+            with self._lock:
+                self._frame = frame
+                self._seq += 1
@@ -54,6 +54,7 @@ class SessionManager:
         # Coordinated timing variables
         self.current_countdown_number = None  # Current countdown display: 3, 2, 1
         self.countdown_start_time = None  # When countdown began
+        self._last_idle_debug = 0.0  # Throttle for the idle status print
 
         # Smile phase tracking
         self.current_smile_seconds = None  # Which photo number (0-based)
@@ -99,10 +100,7 @@ class SessionManager:
         phase = getattr(self.state, "phase", None)
 
         if phase == "idle":
-            if (
-                not hasattr(self, "_last_idle_debug")
-                or now - self._last_idle_debug > 2.0
-            ):
+            if now - self._last_idle_debug > 2.0:
                 print("😴 SessionManager: IDLE state - waiting for button press")
                 self._last_idle_debug = now
             return action
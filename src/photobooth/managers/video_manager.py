@@ -10,7 +10,7 @@ RESPONSIBILITIES:
 KEY METHODS:
 - start_recording(): Begin video+audio recording with session ID and timing
 - stop_recording(): End recording and prepare for file operations
-- write_frame(): Add frame to active video recording
+- write_frame(): Queue frame for the background encoder (never blocks)
 - cleanup(): Clean shutdown of video and audio resources
 
 AUDIO FEATURES:
@@ -29,10 +29,14 @@ ARCHITECTURE:
 - Coordinates with SessionManager through main.py for timing
 - Delegates RTSP management to specialized RTSPCameraManager
 - Ensures video integrity through proper lifecycle management
+- Encodes on a writer thread fed by a bounded queue; when the encoder lags
+  the oldest queued frame is dropped (and counted) rather than stalling
+  the preview
 """
 
 import cv2
 import os
+import queue
 import subprocess
 import threading
 import time
@@ -51,6 +55,11 @@ from .rtsp_camera_manager import RTSPCameraManager
 
 
 class VideoManager:
+    # Default frames buffered for the encoder thread (VIDEO_FRAME_QUEUE)
+    FRAME_QUEUE_MAX = 8
+    # Seconds stop_recording waits for the encoder to flush its queue
+    WRITER_JOIN_TIMEOUT = 2.0
+
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -58,6 +67,11 @@ class VideoManager:
         # Video recording
         self.video_writer = None
         self.recording = False
+        # Encoder thread and its input queue, live only while recording
+        self._frame_queue = None
+        self._writer_thread = None
+        self.dropped_frames = 0
+        self.frame_queue_max = config.get("VIDEO_FRAME_QUEUE", self.FRAME_QUEUE_MAX)
 
         # Audio recording
         self.audio_enabled = AUDIO_AVAILABLE and config.get("ENABLE_AUDIO", True)
@@ -108,8 +122,17 @@ class VideoManager:
                 print(f"[ERROR] Failed to open video writer: {self.video_path}")
                 return False
 
-            self.recording = True
             self._video_size = frame_size
+            self._frame_count = 0
+            self.dropped_frames = 0
+            self._frame_queue = queue.Queue(maxsize=self.frame_queue_max)
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop,
+                args=(self.video_writer, self._frame_queue),
+                daemon=True,
+            )
+            self._writer_thread.start()
+            self.recording = True
             self.logger.debug(
                 "timing", f"🎥 VIDEO RECORDING STARTED: {self.video_filename}.mp4"
             )
@@ -191,20 +214,52 @@ class VideoManager:
             p.terminate()
 
     def write_frame(self, frame):
-        """Write a frame to the video file."""
-        if self.recording and self.video_writer:
+        """
+        Queue a frame for the video file without blocking the caller.
+
+        The frame is copied because the display loop draws overlays into
+        the same array afterwards. If the encoder has fallen behind and the
+        queue is full, the oldest queued frame is dropped first so the
+        recording stays current and the preview keeps its rate; the copy is
+        only made once there is room for it.
+        """
+        frames = self._frame_queue
+        if not self.recording or frames is None:
+            return
+        if frames.full():
+            # Encoder behind: drop the oldest queued frame for this one
             try:
-                if hasattr(self, "_frame_count"):
-                    self._frame_count += 1
-                else:
-                    self._frame_count = 1
+                frames.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped_frames += 1
+            if self.dropped_frames % 30 == 1:
+                print(
+                    f"[DEBUG] Encoder behind, dropped {self.dropped_frames} frames so far"
+                )
+        try:
+            frames.put_nowait(frame.copy())
+        except queue.Full:
+            # Single producer, so the slot freed above should still be free;
+            # never let a race raise into the display loop
+            self.dropped_frames += 1
+
+    def _writer_loop(self, writer, frames):
+        """Encoder thread: write queued frames until the None sentinel."""
+        while True:
+            frame = frames.get()
+            if frame is None:
+                break
+            try:
+                self._frame_count += 1
+                if self._frame_count == 1:
                     print(
                         f"[DEBUG] First frame shape: {frame.shape}, dtype: {frame.dtype}"
                     )
                     print(f"[DEBUG] Video size: {self._video_size}")
 
                 # Simple approach: just write the frame as-is
-                self.video_writer.write(frame)
+                writer.write(frame)
 
                 # Log every 30 frames to avoid spam
                 if self._frame_count % 30 == 0:
@@ -224,12 +279,33 @@ class VideoManager:
         try:
             # Mark as not recording immediately
             self.recording = False
+            video_complete = True
+
+            # Let the encoder finish what is queued before releasing the file
+            if self._writer_thread is not None:
+                try:
+                    self._frame_queue.put(None, timeout=self.WRITER_JOIN_TIMEOUT)
+                except queue.Full:
+                    pass
+                self._writer_thread.join(timeout=self.WRITER_JOIN_TIMEOUT)
+                if self._writer_thread.is_alive():
+                    # Don't release the file under a write still in progress;
+                    # the daemon thread keeps its own reference to the writer
+                    print(
+                        f"[WARN] Video encoder did not finish within "
+                        f"{self.WRITER_JOIN_TIMEOUT}s; abandoning queued frames"
+                    )
+                    self.video_writer = None
+                    video_complete = False
+                self._writer_thread = None
+                self._frame_queue = None
 
             # Stop video recording
             if self.video_writer:
                 frame_count = getattr(self, "_frame_count", 0)
                 print(
                     f"[DEBUG] Stopping video recording with {frame_count} frames written"
+                    f" ({self.dropped_frames} dropped)"
                 )
 
                 self.video_writer.release()
@@ -244,8 +320,11 @@ class VideoManager:
                     self.audio_thread.join(timeout=2.0)  # Wait max 2 seconds
                 self.logger.debug("🎤 AUDIO RECORDING STOPPED")
 
+            if not video_complete:
+                # The file was never finalized: don't mux or publish it
+                print(f"[WARN] Video left incomplete, not published: {self.video_path}")
             # Start async audio/video combination
-            if self.audio_enabled and os.path.exists(self.audio_file):
+            elif self.audio_enabled and os.path.exists(self.audio_file):
                 # Start background thread for ffmpeg processing
                 import threading
 
@@ -0,0 +1,120 @@
+"""
+_pixkern.py
+Fused pixel kernels for the pygame display path (optional Numba JIT)
+
+bgr_to_rgb_transpose_scale() converts a BGR camera frame into pygame's
+column-major (x, y, channel) layout while nearest-neighbour scaling, in a
+single pass: one read of the source bytes, one write of the destination.
+The OpenCV path needs three passes (cvtColor, swapaxes copy, scale).
+
+premul_blit() composites a premultiplied sprite onto a frame ROI in place
+(dst = dst * inv_alpha + premul) as one fused loop; NumPy needs two full
+float temporaries for the same expression.
+
+SpriteBlitter wraps premul_blit with frame clipping and, without Numba,
+a NumPy fallback through a grow-only float32 scratch buffer; the overlay
+renderers share it instead of each carrying a copy.
+
+Numba is optional. When it is not installed NUMBA_AVAILABLE is False and
+callers must keep using the OpenCV/pygame path; the pure-Python loop is
+far too slow to run per frame.
+"""
+
+import numpy as np
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+def _bgr_to_rgb_transpose_scale(src, dst):
+    """
+    Write src (H, W, 3) BGR into dst (dst_w, dst_h, 3) RGB, nearest-neighbour scaled.
+
+    dst is typically a pygame.surfarray.pixels3d() view, indexed [x, y].
+    """
+    src_h = src.shape[0]
+    src_w = src.shape[1]
+    dst_w = dst.shape[0]
+    dst_h = dst.shape[1]
+    for y in _prange(dst_h):
+        src_row = y * src_h // dst_h
+        for x in range(dst_w):
+            src_col = x * src_w // dst_w
+            dst[x, y, 0] = src[src_row, src_col, 2]
+            dst[x, y, 1] = src[src_row, src_col, 1]
+            dst[x, y, 2] = src[src_row, src_col, 0]
+
+
+def _premul_blit(dst, premul, inv_alpha):
+    """
+    Composite a premultiplied sprite onto dst (H, W, 3) uint8, in place.
+
+    premul is (H, W, 3) float32 colour * alpha (+0.5 for rounding) and
+    inv_alpha is (H, W, 1) float32 1 - alpha, as built by OverlayRenderer.
+    """
+    h = dst.shape[0]
+    w = dst.shape[1]
+    for y in _prange(h):
+        for x in range(w):
+            ia = inv_alpha[y, x, 0]
+            for c in range(3):
+                dst[y, x, c] = int(dst[y, x, c] * ia + premul[y, x, c])
+
+
+if NUMBA_AVAILABLE:
+    _prange = numba.prange
+    # First call JIT-compiles; cache=True persists the machine code to disk
+    _jit = numba.njit(parallel=True, cache=True, boundscheck=False, fastmath=True)
+    bgr_to_rgb_transpose_scale = _jit(_bgr_to_rgb_transpose_scale)
+    premul_blit = _jit(_premul_blit)
+else:
+    _prange = range
+    bgr_to_rgb_transpose_scale = _bgr_to_rgb_transpose_scale
+    premul_blit = _premul_blit
+
+
+class SpriteBlitter:
+    """Clip and composite premultiplied sprites onto BGR frames, in place."""
+
+    def __init__(self):
+        # Float32 blend buffer for the NumPy path, grown on demand
+        self._scratch = None
+
+    def blit(self, frame, premul, inv_alpha, x0, y0):
+        """Alpha-composite a sprite with its top-left at (x0, y0), clipped to frame."""
+        fh, fw = frame.shape[:2]
+        lh, lw = premul.shape[:2]
+        x1, y1 = max(x0, 0), max(y0, 0)
+        x2, y2 = min(x0 + lw, fw), min(y0 + lh, fh)
+        if x1 >= x2 or y1 >= y2:
+            return
+        sy = slice(y1 - y0, y2 - y0)
+        sx = slice(x1 - x0, x2 - x0)
+        roi = frame[y1:y2, x1:x2]
+        if NUMBA_AVAILABLE:
+            # Fused JIT loop, no float temporaries
+            premul_blit(roi, premul[sy, sx], inv_alpha[sy, sx])
+        else:
+            # Blend through the persistent float buffer instead of allocating
+            # two ROI-sized temporaries per sprite per frame
+            tmp = self._blend_scratch(y2 - y1, x2 - x1)
+            np.multiply(roi, inv_alpha[sy, sx], out=tmp)
+            tmp += premul[sy, sx]
+            roi[...] = tmp
+
+    def _blend_scratch(self, h, w):
+        """Return an (h, w, 3) float32 view of the reusable blend buffer."""
+        buf = self._scratch
+        if buf is None or buf.shape[0] < h or buf.shape[1] < w:
+            # Grow to the largest ROI seen so far; text sprites are stable in size
+            bh, bw = h, w
+            if buf is not None:
+                bh, bw = max(h, buf.shape[0]), max(w, buf.shape[1])
+            buf = np.empty((bh, bw, 3), dtype=np.float32)
+            self._scratch = buf
+        return buf[:h, :w]
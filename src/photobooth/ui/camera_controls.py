@@ -3,10 +3,31 @@ camera_controls.py
 Handles live camera adjustment controls during preview
 """
 
+import time
+
 import cv2
 
 
 class CameraControls:
+    # Picamera2 AwbMode index -> name, with display labels built once
+    WB_MODES = (
+        "Auto",
+        "Incandescent",
+        "Tungsten",
+        "Fluorescent",
+        "Indoor",
+        "Daylight",
+        "Cloudy",
+    )
+    _WB_LABELS = tuple(f"{name} (Mode {idx})" for idx, name in enumerate(WB_MODES))
+    _WB_TEMPLATE = "🎨 White Balance: {}"
+    _BRIGHTNESS_TEMPLATE = "💡 Brightness: {:.1f}"
+    _CONTRAST_TEMPLATE = "🔳 Contrast: {:.1f}"
+    _SATURATION_TEMPLATE = "🌈 Saturation: {:.1f}"
+
+    # Minimum spacing between overlay pushes; key-repeat bursts coalesce into one
+    OVERLAY_FLUSH_INTERVAL = 0.05
+
     def __init__(self, camera, lighting_config, settings_overlay=None):
         self.camera = camera
         self.lighting_config = lighting_config
@@ -21,15 +42,12 @@ class CameraControls:
         self.current_gain = lighting_config.get("AnalogueGain", 1.0)
         self.current_noise_reduction = lighting_config.get("NoiseReductionMode", 0)
 
-        self.wb_modes = [
-            "Auto",
-            "Incandescent",
-            "Tungsten",
-            "Fluorescent",
-            "Indoor",
-            "Daylight",
-            "Cloudy",
-        ]
+        self.wb_modes = self.WB_MODES
+
+        # Pending overlay changes; seeded with a full snapshot so the first
+        # flush gives the overlay every field it draws
+        self._dirty = self._overlay_snapshot()
+        self._last_flush = 0.0
 
     def handle_key(self, key):
         """Handle camera control key presses. Returns True if key was handled."""
@@ -87,14 +105,11 @@ class CameraControls:
         if hasattr(self.camera, "picam2") and self.camera.picam2:
             self.camera.picam2.set_controls({"AwbMode": self.current_wb_mode})
         
-        message = f"🎨 White Balance: {self.wb_modes[self.current_wb_mode]} (Mode {self.current_wb_mode})"
-        print(message)
+        label = self._WB_LABELS[self.current_wb_mode]
+        print(self._WB_TEMPLATE.format(label))
         if self.settings_overlay:
-            self.settings_overlay.show_setting_change(
-                "White Balance",
-                f"{self.wb_modes[self.current_wb_mode]} (Mode {self.current_wb_mode})",
-            )
-            self._update_overlay_settings()
+            self.settings_overlay.show_setting_change("White Balance", label)
+            self._push_change(wb_mode=self.current_wb_mode)
 
     def _adjust_brightness(self, delta):
         """Adjust brightness by delta."""
@@ -108,13 +123,12 @@ class CameraControls:
             opencv_brightness = int((self.current_brightness + 1.0) * 127.5)
             self.camera.cap.set(cv2.CAP_PROP_BRIGHTNESS, opencv_brightness)
         
-        message = f"💡 Brightness: {self.current_brightness:.1f}"
-        print(message)
+        print(self._BRIGHTNESS_TEMPLATE.format(self.current_brightness))
         if self.settings_overlay:
             self.settings_overlay.show_setting_change(
                 "Brightness", f"{self.current_brightness:.2f}"
             )
-            self._update_overlay_settings()
+            self._push_change(brightness=self.current_brightness)
 
     def _adjust_contrast(self, delta):
         """Adjust contrast by delta."""
@@ -128,12 +142,12 @@ class CameraControls:
             opencv_contrast = int(self.current_contrast * 127.5)
             self.camera.cap.set(cv2.CAP_PROP_CONTRAST, opencv_contrast)
             
-        print(f"🔳 Contrast: {self.current_contrast:.1f}")
+        print(self._CONTRAST_TEMPLATE.format(self.current_contrast))
         if self.settings_overlay:
             self.settings_overlay.show_setting_change(
                 "Contrast", f"{self.current_contrast:.2f}"
             )
-            self._update_overlay_settings()
+            self._push_change(contrast=self.current_contrast)
 
     def _adjust_saturation(self, delta):
         """Adjust saturation by delta."""
@@ -147,12 +161,12 @@ class CameraControls:
             opencv_saturation = int(self.current_saturation * 127.5)
             self.camera.cap.set(cv2.CAP_PROP_SATURATION, opencv_saturation)
             
-        print(f"🌈 Saturation: {self.current_saturation:.1f}")
+        print(self._SATURATION_TEMPLATE.format(self.current_saturation))
         if self.settings_overlay:
             self.settings_overlay.show_setting_change(
                 "Saturation", f"{self.current_saturation:.2f}"
             )
-            self._update_overlay_settings()
+            self._push_change(saturation=self.current_saturation)
 
     def _adjust_exposure(self, delta):
         """Adjust exposure by delta microseconds."""
@@ -198,6 +212,8 @@ class CameraControls:
         self.camera.picam2.set_controls(reset_controls)
         lighting_mode = self.lighting_config.get("_mode", "unknown")
         print(f"🔄 Reset to {lighting_mode} defaults")
+        if self.settings_overlay:
+            self._dirty.update(self._overlay_snapshot())
 
     def _show_help(self):
         """Display help for camera controls."""
@@ -224,16 +240,35 @@ class CameraControls:
         print("  E(exposure ±), G(gain ±), N(noise reduction), R(reset to defaults)")
         print("  H = show this help again")
 
-    def _update_overlay_settings(self):
-        """Update the settings overlay with current values."""
-        if self.settings_overlay:
-            self.settings_overlay.update_current_settings(
-                self.current_wb_mode,
-                self.wb_modes,
-                self.current_brightness,
-                self.current_contrast,
-                self.current_saturation,
-                self.current_exposure,
-                self.current_gain,
-                self.current_noise_reduction,
-            )
+    def _overlay_snapshot(self):
+        """Return every setting the overlay displays."""
+        return {
+            "wb_mode": self.current_wb_mode,
+            "wb_modes": self.wb_modes,
+            "brightness": self.current_brightness,
+            "contrast": self.current_contrast,
+            "saturation": self.current_saturation,
+            "exposure": self.current_exposure,
+            "gain": self.current_gain,
+            "noise_reduction": self.current_noise_reduction,
+        }
+
+    def _push_change(self, **changes):
+        """Queue changed settings for the next overlay flush."""
+        self._dirty.update(changes)
+
+    def flush_overlay(self, now=None):
+        """
+        Push queued setting changes to the overlay in one update.
+
+        Call from the render loop; pushes are rate-limited to
+        OVERLAY_FLUSH_INTERVAL so rapid key repeats cost one update.
+        """
+        if not self._dirty or not self.settings_overlay:
+            return
+        now = time.monotonic() if now is None else now
+        if now - self._last_flush < self.OVERLAY_FLUSH_INTERVAL:
+            return
+        self.settings_overlay.update_current_settings(**self._dirty)
+        self._dirty.clear()
+        self._last_flush = now
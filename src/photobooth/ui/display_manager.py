@@ -6,12 +6,19 @@ Handles display setup and rendering for both pygame and OpenCV
 import os
 import pygame
 import cv2
+import numpy as np
 
 import logging
 import time
 
+from photobooth.ui._pixkern import NUMBA_AVAILABLE, bgr_to_rgb_transpose_scale
+from photobooth.ui.framebuffer_display import FramebufferDisplay
+
 
 class DisplayManager:
+    # Seconds without a new camera frame before (and between) stall warnings
+    CAMERA_STALL_WARN_S = 2.0
+
     def __init__(
         self,
         config,
@@ -20,6 +27,7 @@ class DisplayManager:
         session_manager,
         keyboard_input_manager=None,
         logger=None,
+        frame_source=None,
     ):
         self.config = config
         self.logger = logger or logging.getLogger("DisplayManager")
@@ -29,12 +37,46 @@ class DisplayManager:
         self.overlay_renderer = overlay_renderer
         self.session_manager = session_manager
         self.keyboard_input_manager = keyboard_input_manager
+        # Optional ThreadedFrameSource; run() falls back to blocking get_frame()
+        self.frame_source = frame_source
+        self._last_frame_seq = None
+        # perf_counter() of the last new frame / last stall warning
+        self._last_new_frame_t = None
+        self._stall_warned_t = None
 
         # Display state
         self.screen = None
         self.use_pygame = False
+        # Direct /dev/fb0 output (USE_DIRECT_FB on a console VT), else None
+        self.fb_display = None
         self.window_name = config["WINDOW_NAME"]
 
+        # Cached screen geometry (the pygame screen never resizes after setup)
+        self._screen_size = None
+        self._screen_w = 0
+        self._screen_h = 0
+        # Frames are blitted 1:1 at the top-left unless aspect-fit scaling
+        # and centring are requested
+        self._scale_to_fit = bool(config.get("PREVIEW_SCALE_TO_FIT", False))
+        # Scale parameters, recomputed only when the camera frame size changes
+        self._frame_size = None
+        self._scaled_size = None
+        self._blit_pos = (0, 0)
+        # Source/target sizes for the pixel kernel (clipped to the screen 1:1)
+        self._kernel_src_size = None
+        self._kernel_dst_size = None
+        # Frame shape the overlay sprites were last prewarmed for
+        self._prewarmed_shape = None
+        # Surfaces in the display's native pixel format, reused every frame
+        self._preview_surf = None
+        self._scaled_surf = None
+        # BGR->RGB conversion target for the OpenCV path, sized per layout
+        self._rgb_buf = None
+        # Fused Numba kernel writes straight into the screen surface when usable
+        self._use_pixkern = NUMBA_AVAILABLE
+        # OpenCV >= 4.1 pollKey returns immediately; waitKey(1) may sleep ~1 ms
+        self._poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
         # Environment detection
         self.is_linux = os.name == "posix"
         self.has_display_server = bool(
@@ -65,11 +107,34 @@ class DisplayManager:
             f"SSH_SESSION={self.ssh_session} ON_CONSOLE_VT={self.on_console_vt} USE_PYGAME_DISPLAY={self.use_pygame}"
         )
 
+        if self._should_use_framebuffer() and self._setup_framebuffer():
+            return
         if self.use_pygame:
             self._setup_pygame()
         else:
             self._setup_opencv()
 
+    def _should_use_framebuffer(self):
+        """Direct framebuffer output only on a bare console VT, and only on request."""
+        return (
+            self.config.get("USE_DIRECT_FB", False)
+            and self.is_linux
+            and self.on_console_vt
+            and not self.has_display_server
+        )
+
+    def _setup_framebuffer(self):
+        """Map the framebuffer; returns False so the caller can fall back to pygame."""
+        device = self.config.get("FRAMEBUFFER_DEVICE", "/dev/fb0")
+        try:
+            self.fb_display = FramebufferDisplay(device, logger=self.logger)
+        except Exception as e:
+            self.logger.warning(f"Direct framebuffer {device} unavailable: {e}")
+            self.fb_display = None
+            return False
+        self.use_pygame = False
+        return True
+
     def _should_use_pygame(self):
         """Determine if pygame should be used for display."""
         if not self.is_linux:
@@ -82,16 +147,31 @@ class DisplayManager:
 
     def _setup_pygame(self):
         """Setup pygame display."""
-        pygame.display.init()
-
         # Try different SDL drivers
         drivers = self.config.get(
             "PYGAME_DRIVERS", ["kmsdrm", "fbcon", "directfb", "svgalib"]
         )
+        # Lowest latency over tear-free: a vsynced flip blocks until the next
+        # refresh and compositors can queue an extra frame behind it
+        vsync = int(self.config.get("PYGAME_VSYNC", 0))
 
-        for drv in drivers:
-            try:
+        # Last resort: whatever SDL picks itself (x11/wayland under a
+        # desktop session), honouring an SDL_VIDEODRIVER set by the user
+        default_driver = os.environ.get("SDL_VIDEODRIVER")
+
+        for drv in [*drivers, None]:
+            # SDL latches the video driver on init, so shut the display
+            # subsystem down before switching SDL_VIDEODRIVER (no-op if not
+            # initialised yet) and probe each driver exactly once
+            pygame.display.quit()
+            if drv is not None:
                 os.environ["SDL_VIDEODRIVER"] = drv
+            elif default_driver is not None:
+                os.environ["SDL_VIDEODRIVER"] = default_driver
+            else:
+                os.environ.pop("SDL_VIDEODRIVER", None)
+            drv = drv or "SDL default"
+            try:
                 self.logger.debug(f"[INFO] Trying SDL driver: {drv}")
 
                 pygame.display.init()
@@ -100,7 +180,7 @@ class DisplayManager:
                 if self.config.get("WINDOWED", False):
                     # Windowed mode for development
                     screen_size = (1024, 768)
-                    self.screen = pygame.display.set_mode(screen_size, 0)
+                    self.screen = pygame.display.set_mode(screen_size, 0, vsync=vsync)
                     pygame.mouse.set_visible(True)
                     pygame.display.set_caption("PhotoBooth Scare - Development Mode")
                     self.logger.info(
@@ -110,7 +190,7 @@ class DisplayManager:
                     # Fullscreen mode for production
                     screen_size = (info.current_w, info.current_h)
                     self.screen = pygame.display.set_mode(
-                        screen_size, pygame.FULLSCREEN
+                        screen_size, pygame.FULLSCREEN, vsync=vsync
                     )
                     pygame.mouse.set_visible(False)
                     self.logger.info(
@@ -123,10 +203,16 @@ class DisplayManager:
 
         if self.screen is None:
             self.logger.error(
-                "No suitable SDL framebuffer driver worked; falling back to OpenCV"
+                "No suitable SDL video driver worked; falling back to OpenCV"
             )
             self.use_pygame = False
             self._setup_opencv()
+            return
+
+        # Window is created without RESIZABLE, so no VIDEORESIZE events can
+        # arrive and the size is safe to cache for the lifetime of the display.
+        self._screen_size = self.screen.get_size()
+        self._screen_w, self._screen_h = self._screen_size
 
     def _setup_opencv(self):
         """Setup OpenCV display."""
@@ -165,22 +251,119 @@ class DisplayManager:
                 f"DisplayManager: show_frame called with empty frame (shape={frame.shape})"
             )
             return
-        if self.use_pygame:
+        if self.fb_display is not None:
+            self.fb_display.show_frame(frame)
+        elif self.use_pygame:
             if self.screen is not None:
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                surf = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
-                self.screen.blit(surf, (0, 0))
-                pygame.display.flip()
+                self._show_pygame_frame(frame)
         else:
             cv2.imshow(self.window_name, frame)
-            cv2.waitKey(1)  # Always call waitKey to keep window responsive
+            self._poll_key()  # Always pump events to keep window responsive
         # No recursion, no loop, just display the frame
 
+    def _update_scale_params(self, frame_w, frame_h):
+        """Compute blit size and position for a frame size (1:1 or aspect-fit)."""
+        self._frame_size = (frame_w, frame_h)
+        if self._scale_to_fit:
+            scale = min(self._screen_w / frame_w, self._screen_h / frame_h)
+            scaled_w = int(frame_w * scale)
+            scaled_h = int(frame_h * scale)
+            self._scaled_size = (scaled_w, scaled_h)
+            self._blit_pos = (
+                (self._screen_w - scaled_w) // 2,
+                (self._screen_h - scaled_h) // 2,
+            )
+            self._kernel_src_size = self._frame_size
+            self._kernel_dst_size = self._scaled_size
+        else:
+            # SDL clips the blit itself; the kernel must be given the
+            # on-screen part only or it would scale the frame down
+            self._scaled_size = self._frame_size
+            self._blit_pos = (0, 0)
+            visible = (min(frame_w, self._screen_w), min(frame_h, self._screen_h))
+            self._kernel_src_size = visible
+            self._kernel_dst_size = visible
+        # Clear any letterbox borders left over from a previous layout
+        self.screen.fill((0, 0, 0))
+        self._rgb_buf = np.empty((frame_h, frame_w, 3), dtype=np.uint8)
+        self._build_preview_surfaces()
+
+    def _build_preview_surfaces(self):
+        """Allocate display-format source/scaled surfaces for the current layout."""
+        try:
+            # convert() matches the screen's pixel format, so the per-frame
+            # blit is a plain copy instead of an SDL format conversion
+            self._preview_surf = pygame.Surface(self._frame_size).convert()
+            self._scaled_surf = pygame.Surface(self._scaled_size).convert()
+            # pixels3d needs a 24/32-bit surface; probe once here
+            probe = pygame.surfarray.pixels3d(self._preview_surf)
+            del probe
+        except Exception as e:
+            self.logger.warning(f"Preview surfaces unavailable, using frombuffer: {e}")
+            self._preview_surf = None
+            self._scaled_surf = None
+
+    def _show_pygame_frame(
+        self,
+        frame,
+        _cvt=cv2.cvtColor,
+        _bgr2rgb=cv2.COLOR_BGR2RGB,
+        _pixels3d=pygame.surfarray.pixels3d,
+        _frombuffer=pygame.image.frombuffer,
+        _scale=pygame.transform.scale,
+        _flip=pygame.display.flip,
+        _kernel=bgr_to_rgb_transpose_scale,
+    ):
+        """
+        Display frame using pygame, 1:1 or scaled to fit the cached screen size.
+
+        The keyword defaults bind per-frame callables once at definition
+        time so the hot path uses local lookups; callers never pass them.
+        """
+        h, w = frame.shape[:2]
+        if (w, h) != self._frame_size:
+            self._update_scale_params(w, h)
+
+        if self._use_pixkern:
+            try:
+                x, y = self._blit_pos
+                fw, fh = self._kernel_src_size
+                sw, sh = self._kernel_dst_size
+                pixels = _pixels3d(self.screen)
+                _kernel(frame[:fh, :fw], pixels[x : x + sw, y : y + sh])
+                # Release the surface lock before flipping
+                del pixels
+                _flip()
+                return
+            except Exception as e:
+                # e.g. 16-bit framebuffer surfaces cannot be mapped by pixels3d
+                self.logger.warning(f"Pixel kernel unavailable, using OpenCV path: {e}")
+                self._use_pixkern = False
+
+        frame_rgb = _cvt(frame, _bgr2rgb, dst=self._rgb_buf)
+        if self._preview_surf is not None:
+            # Format conversion happens on assignment into the converted surface
+            pixels = _pixels3d(self._preview_surf)
+            pixels[...] = frame_rgb.swapaxes(0, 1)
+            del pixels
+            if self._scaled_size != self._frame_size:
+                surf = _scale(self._preview_surf, self._scaled_size, self._scaled_surf)
+            else:
+                surf = self._preview_surf
+        else:
+            # cvtColor output is C-contiguous, so SDL can wrap it with a single
+            # memcpy instead of make_surface's strided per-pixel copy
+            surf = _frombuffer(frame_rgb, self._frame_size, "RGB")
+            if self._scaled_size != self._frame_size:
+                surf = _scale(surf, self._scaled_size)
+        self.screen.blit(surf, self._blit_pos)
+        _flip()
+
     def _show_opencv_frame(self, frame):
         """Display frame using OpenCV."""
         try:
             cv2.imshow(self.window_name, frame)
-            key = cv2.waitKey(1) & 0xFF
+            key = self._poll_key() & 0xFF
             if key != 255:  # 255 means no key pressed
                 return key
         except Exception:
@@ -190,7 +373,10 @@ class DisplayManager:
 
     def cleanup(self):
         """Cleanup display resources."""
-        if self.use_pygame:
+        if self.fb_display is not None:
+            self.fb_display.cleanup()
+            self.fb_display = None
+        elif self.use_pygame:
             try:
                 pygame.quit()
             except Exception:
@@ -201,6 +387,42 @@ class DisplayManager:
             except Exception:
                 pass
 
+    def _pump_input(self, state):
+        """Process pending window/keyboard events once; returns True on quit."""
+        if self.fb_display is not None:
+            # No window system: input arrives through GPIO only
+            return False
+        if self.use_pygame:
+            if self.keyboard_input_manager is None:
+                pygame.event.pump()
+            elif self.keyboard_input_manager.handle_pygame_events(state):
+                self.logger.info("Quit requested by keyboard input (pygame backend).")
+                return True
+            return False
+        # Only poll keys once per loop, use result for both display and input
+        key = self._poll_key()
+        if self.keyboard_input_manager is not None:
+            if self.keyboard_input_manager.handle_opencv_key(key, state):
+                self.logger.info("Quit requested by keyboard input (opencv backend).")
+                return True
+        return False
+
+    def _warn_if_camera_stalled(self):
+        """Warn, at most every CAMERA_STALL_WARN_S, while no new frame arrives."""
+        now = time.perf_counter()
+        if now - self._last_new_frame_t < self.CAMERA_STALL_WARN_S:
+            return
+        if (
+            self._stall_warned_t is not None
+            and now - self._stall_warned_t < self.CAMERA_STALL_WARN_S
+        ):
+            return
+        self._stall_warned_t = now
+        self.logger.warning(
+            f"DisplayManager: no new camera frame for "
+            f"{now - self._last_new_frame_t:.1f}s"
+        )
+
     def run(self):
         """
         Main display loop: fetch frames, apply overlay, display. Exits on quit flag.
@@ -208,54 +430,68 @@ class DisplayManager:
         NOTE: This method must be called from the main thread when using OpenCV or pygame display backends,
         especially on Windows. GUI operations in background threads may result in no window or display issues.
         """
+        # Deadline pacing: sleep only the slack left in each frame slot, and
+        # never when the frame already overran it
+        frame_budget = 1.0 / self.config.get("PREVIEW_FPS", 30)
+        next_deadline = time.perf_counter()
+
+        self._last_new_frame_t = time.perf_counter()
 
         while True:
-            frame = self.camera_manager.get_frame()
-            print(
-                f"[DEBUG] camera_manager.get_frame() -> {type(frame)}, shape={getattr(frame, 'shape', None)}"
-            )
+            if self.frame_source is not None:
+                frame, seq = self.frame_source.read()
+                if seq == self._last_frame_seq:
+                    # No new frame grabbed yet; don't redraw the same one,
+                    # but keep the window and quit keys responsive
+                    self._warn_if_camera_stalled()
+                    if self._pump_input(self.session_manager.state):
+                        return
+                    time.sleep(0.001)
+                    continue
+                self._last_frame_seq = seq
+                self._last_new_frame_t = time.perf_counter()
+            else:
+                frame = self.camera_manager.get_frame()
             if frame is None:
                 self.logger.warning(
                     "DisplayManager: camera_manager.get_frame() returned None"
                 )
+                if self._pump_input(self.session_manager.state):
+                    return
                 time.sleep(0.05)
                 continue
 
+            # Build countdown sprites up front so the countdown only blits
+            if frame.shape != self._prewarmed_shape:
+                if hasattr(self.overlay_renderer, "prewarm"):
+                    h, w = frame.shape[:2]
+                    self.overlay_renderer.prewarm(w, h)
+                self._prewarmed_shape = frame.shape
+
             # Update session state machine every frame
             self.session_manager.update(time.time(), frame.shape[:2])
 
             # Get current state (idle, etc.)
             state = self.session_manager.state
             frame_with_overlay = self.overlay_renderer.draw_overlay(frame, state)
-            print(
-                f"[DEBUG] overlay_renderer.draw_overlay() -> {type(frame_with_overlay)}, shape={getattr(frame_with_overlay, 'shape', None)}"
-            )
             if frame_with_overlay is None:
                 self.logger.warning(
                     "DisplayManager: overlay_renderer.draw_overlay() returned None"
                 )
-            key = None
-            if self.use_pygame:
+            if self.fb_display is not None:
+                self.fb_display.show_frame(frame_with_overlay)
+            elif self.use_pygame:
                 self.show_frame(frame_with_overlay)
-                if self.keyboard_input_manager is not None:
-                    if self.keyboard_input_manager.handle_pygame_events(state):
-                        self.logger.info(
-                            "Quit requested by keyboard input (pygame backend)."
-                        )
-                        return
-                else:
-                    time.sleep(0.01)
             else:
-                import cv2
-
-                # Only call waitKey once per loop, use result for both display and input
                 cv2.imshow(self.window_name, frame_with_overlay)
-                key = cv2.waitKey(1)
-                if self.keyboard_input_manager is not None:
-                    if self.keyboard_input_manager.handle_opencv_key(key, state):
-                        self.logger.info(
-                            "Quit requested by keyboard input (opencv backend)."
-                        )
-                        return
-                else:
-                    time.sleep(0.01)
+            if self._pump_input(state):
+                return
+
+            next_deadline += frame_budget
+            slack = next_deadline - time.perf_counter()
+            if slack > 0:
+                time.sleep(slack)
+            else:
+                # Behind schedule: run at the camera-limited rate rather than
+                # bursting to catch up on missed slots
+                next_deadline = time.perf_counter()
@@ -0,0 +1,163 @@
+"""
+framebuffer_display.py
+Direct Linux framebuffer (/dev/fb0) output for console-VT kiosks
+
+Frames are scaled into a cached buffer and colour-converted by
+cv2.cvtColor straight into a NumPy view of the mmap'd framebuffer, so
+there is no SDL initialisation, no intermediate surface and no flip.
+Supports 16 bpp (BGR565) and 32 bpp (BGRA) framebuffers.
+
+Layout uses the visible resolution (FBIOGET_VSCREENINFO xres/yres and
+pan offset, else the sysfs mode), not virtual_size, which drivers often
+double for page flipping.
+"""
+
+import fcntl
+import mmap
+import os
+import re
+import struct
+import logging
+
+import cv2
+import numpy as np
+
+
+class FramebufferDisplay:
+    # bits_per_pixel -> (cvtColor code, bytes per pixel)
+    FORMATS = {
+        16: (cv2.COLOR_BGR2BGR565, 2),
+        32: (cv2.COLOR_BGR2BGRA, 4),
+    }
+    # linux/fb.h; struct fb_var_screeninfo is 160 bytes and starts with
+    # xres, yres, xres_virtual, yres_virtual, xoffset, yoffset (__u32)
+    FBIOGET_VSCREENINFO = 0x4600
+    VSCREENINFO_SIZE = 160
+
+    def __init__(self, device="/dev/fb0", sysfs_dir=None, logger=None):
+        self.logger = logger or logging.getLogger("FramebufferDisplay")
+        name = os.path.basename(device)
+        sysfs_dir = sysfs_dir or f"/sys/class/graphics/{name}"
+
+        virtual_w, virtual_h = (
+            int(v) for v in self._read_sysfs(sysfs_dir, "virtual_size").split(",")
+        )
+        bpp = int(self._read_sysfs(sysfs_dir, "bits_per_pixel"))
+        if bpp not in self.FORMATS:
+            raise RuntimeError(f"Unsupported framebuffer depth: {bpp} bpp")
+        self._cvt_code, bytes_pp = self.FORMATS[bpp]
+        try:
+            stride = int(self._read_sysfs(sysfs_dir, "stride"))
+        except OSError:
+            stride = virtual_w * bytes_pp
+
+        self._fd = os.open(device, os.O_RDWR)
+        try:
+            width, height, x_off, y_off = self._visible_area(
+                sysfs_dir, virtual_w, virtual_h
+            )
+            # Map the whole virtual buffer; only the visible part is drawn to
+            self._mmap = mmap.mmap(
+                self._fd, stride * virtual_h, mmap.MAP_SHARED, mmap.PROT_WRITE
+            )
+        except Exception:
+            os.close(self._fd)
+            raise
+        # Rows are `stride` bytes apart; the view drops any padding columns
+        # and everything outside the visible (panned) area
+        rows = np.frombuffer(self._mmap, dtype=np.uint8).reshape(virtual_h, stride)
+        visible = rows[
+            y_off : y_off + height, x_off * bytes_pp : (x_off + width) * bytes_pp
+        ]
+        self._fb = visible.reshape(height, width, bytes_pp)
+        self._fb[:] = 0
+
+        self.size = (width, height)
+        # Per-frame-size layout: scaled BGR buffer and target view in the fb
+        self._frame_size = None
+        self._scaled_buf = None
+        self._fb_view = None
+        self.logger.info(f"Framebuffer {device}: {width}x{height} @ {bpp} bpp")
+
+    @staticmethod
+    def _read_sysfs(sysfs_dir, attr):
+        with open(os.path.join(sysfs_dir, attr), "r") as f:
+            return f.read().strip()
+
+    def _visible_area(self, sysfs_dir, virtual_w, virtual_h):
+        """Return (width, height, x_offset, y_offset) of the on-screen area."""
+        try:
+            info = fcntl.ioctl(
+                self._fd, self.FBIOGET_VSCREENINFO, bytes(self.VSCREENINFO_SIZE)
+            )
+            xres, yres, _, _, x_off, y_off = struct.unpack_from("6I", info)
+            if 0 < xres and 0 < yres:
+                # Clamp so a bogus pan offset cannot push the view off the map
+                x_off = min(x_off, virtual_w - min(xres, virtual_w))
+                y_off = min(y_off, virtual_h - min(yres, virtual_h))
+                return min(xres, virtual_w), min(yres, virtual_h), x_off, y_off
+        except OSError:
+            pass
+        # No ioctl (e.g. not a real fb device): the sysfs video mode, e.g.
+        # "U:1920x1080p-0"; "mode" is the current one, "modes" lists the
+        # current one first
+        match = None
+        for attr in ("mode", "modes"):
+            try:
+                match = re.search(r"(\d+)x(\d+)", self._read_sysfs(sysfs_dir, attr))
+            except OSError:
+                continue
+            if match:
+                break
+        if match:
+            return (
+                min(int(match.group(1)), virtual_w),
+                min(int(match.group(2)), virtual_h),
+                0,
+                0,
+            )
+        return virtual_w, virtual_h, 0, 0
+
+    def _update_layout(self, frame_w, frame_h):
+        """Compute aspect-preserving scale and centred target for a frame size."""
+        screen_w, screen_h = self.size
+        scale = min(screen_w / frame_w, screen_h / frame_h)
+        scaled_w = int(frame_w * scale)
+        scaled_h = int(frame_h * scale)
+        x = (screen_w - scaled_w) // 2
+        y = (screen_h - scaled_h) // 2
+        # Clear any letterbox borders left over from a previous layout
+        self._fb[:] = 0
+        self._frame_size = (frame_w, frame_h)
+        self._fb_view = self._fb[y : y + scaled_h, x : x + scaled_w]
+        if (scaled_w, scaled_h) != (frame_w, frame_h):
+            self._scaled_buf = np.empty((scaled_h, scaled_w, 3), dtype=np.uint8)
+        else:
+            self._scaled_buf = None
+
+    def show_frame(self, frame):
+        """Scale a BGR frame to fit and write it straight into the framebuffer."""
+        h, w = frame.shape[:2]
+        if (w, h) != self._frame_size:
+            self._update_layout(w, h)
+        if self._scaled_buf is not None:
+            frame = cv2.resize(
+                frame,
+                (self._scaled_buf.shape[1], self._scaled_buf.shape[0]),
+                dst=self._scaled_buf,
+                interpolation=cv2.INTER_NEAREST,
+            )
+        cv2.cvtColor(frame, self._cvt_code, dst=self._fb_view)
+
+    def cleanup(self):
+        """Release the framebuffer mapping."""
+        self._fb = None
+        self._fb_view = None
+        try:
+            self._mmap.close()
+        except Exception:
+            pass
+        try:
+            os.close(self._fd)
+        except Exception:
+            pass
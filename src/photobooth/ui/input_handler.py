@@ -21,17 +21,36 @@ class InputHandler:
     No business logic - just translates user input to session manager methods.
     """
 
+    # Contact-bounce window for raw GPIO edges (~20 ms covers typical switches)
+    GPIO_BOUNCE_MS = 20
+
     def __init__(self, session_manager, gpio_manager=None):
         self.session_manager = session_manager
         self.gpio_manager = gpio_manager
 
-        # Debouncing for button presses
-        self.last_button_time = 0
+        # Debouncing for button presses (session-level "already pressed" guard)
+        # Monotonic nanoseconds, so NTP steps cannot re-arm or stall it
+        self.last_button_ns = None
         self.button_debounce_seconds = 2.0
+        self._button_debounce_ns = int(self.button_debounce_seconds * 1_000_000_000)
+
+        # Edge-level bounce filter, separate from the session guard above
+        self._gpio_bounce_ns = self.GPIO_BOUNCE_MS * 1_000_000
+        self._last_gpio_edge_ns = None
 
-        # Set up GPIO callback if available
+        # Key name -> handler; a handler returning True requests quit
+        self._dispatch = {
+            "quit": self._handle_quit,
+            "button": self._handle_button_press,
+            "status": self._handle_status_request,
+        }
+
+        # Set up GPIO callback if available; let the driver drop bounces
+        # before they ever wake Python
         if self.gpio_manager:
-            self.gpio_manager.add_event_detect(self._on_gpio_button_press)
+            self.gpio_manager.add_event_detect(
+                self._on_gpio_button_press, bouncetime_ms=self.GPIO_BOUNCE_MS
+            )
 
     def handle_key_event(self, key_pressed: str) -> bool:
         """
@@ -43,28 +62,28 @@ class InputHandler:
         Returns:
             bool: True if should quit application, False otherwise
         """
-        if key_pressed == "quit":
-            print("🛑 InputHandler: Quit requested")
-            return True
-
-        elif key_pressed == "button":
-            print("🔘 InputHandler: Button press detected (SPACE key)")
-            self._handle_button_press()
-
-        elif key_pressed == "status":
-            print("📊 InputHandler: Status requested")
-            self._handle_status_request()
-
-        return False
+        # Common case: no key this frame
+        if not key_pressed:
+            return False
+        handler = self._dispatch.get(key_pressed)
+        if handler is None:
+            return False
+        return handler() is True
+
+    def _handle_quit(self):
+        """Handle quit request"""
+        print("🛑 InputHandler: Quit requested")
+        return True
 
     def _handle_button_press(self):
         """Handle button press event with debouncing"""
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
 
         # Debounce button presses
-        if current_time - self.last_button_time < self.button_debounce_seconds:
+        last_ns = self.last_button_ns
+        if last_ns is not None and now_ns - last_ns < self._button_debounce_ns:
             print(
-                f"🔘 InputHandler: Button debounced (too soon: {current_time - self.last_button_time:.1f}s)"
+                f"🔘 InputHandler: Button debounced (too soon: {(now_ns - last_ns) / 1e9:.1f}s)"
             )
             return
 
@@ -73,7 +92,7 @@ class InputHandler:
             print("🔘 InputHandler: Button ignored (session already active)")
             return
 
-        self.last_button_time = current_time
+        self.last_button_ns = now_ns
         print("🔘 InputHandler: Starting countdown via SessionManager")
         self.session_manager.start_countdown()
 
@@ -91,6 +110,13 @@ class InputHandler:
 
     def _on_gpio_button_press(self, channel):
         """GPIO callback for hardware button press"""
+        # Coalesce contact bounce: drop edges within GPIO_BOUNCE_MS of the
+        # last accepted one, before any logging or session work
+        now_ns = time.monotonic_ns()
+        last_ns = self._last_gpio_edge_ns
+        if last_ns is not None and now_ns - last_ns < self._gpio_bounce_ns:
+            return
+        self._last_gpio_edge_ns = now_ns
         print(f"🔘 InputHandler: GPIO button pressed (pin {channel})")
         self._handle_button_press()
 
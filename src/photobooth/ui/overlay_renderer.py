@@ -8,17 +8,20 @@ RESPONSIBILITIES:
 - Provides visual feedback for all photobooth session phases
 
 KEY METHODS:
-- draw_overlay(): Main rendering method that draws appropriate overlays based on state
-- draw_countdown(): Large countdown numbers with pulsing animation
-- draw_gotcha_text(): Scare text with dramatic visual effects
-- draw_idle_text(): Instructions when system is waiting for user
-- draw_qr_overlay(): QR code display with "Scan for Photos" caption
+- draw_overlay(): Main rendering method; dispatches on state.phase via _phase_renderers
+- _draw_countdown(): Large countdown numbers, then "SMILE!"
+- _draw_smile(): "SMILE!" while photos are taken
+- _draw_gotcha(): Scare text with dramatic visual effects, plus the QR panel
+- _draw_idle(): Blinking instructions when system is waiting for user
+- _draw_qr_overlay(): QR code display with "Scan for Photos" caption
 
 RENDERING FEATURES:
 - Creepster font support via PIL for Halloween theming
 - OpenCV fallback for systems without PIL/custom fonts
 - Responsive text sizing based on frame dimensions
 - Visual effects including shadows, outlines, and animations
+- Text is rasterized into small cached sprites and blended into the frame
+  in place; the camera frame itself is never converted to a PIL image
 
 ARCHITECTURE:
 - Pure rendering class following Single Responsibility principle
@@ -30,14 +33,34 @@ ARCHITECTURE:
 import os
 import cv2
 import time
+import logging
+import functools
+from collections import OrderedDict
+from types import SimpleNamespace
+
 import numpy as np
 
-try:
-    from PIL import ImageFont, ImageDraw, Image
-except ImportError:
-    ImageFont = None
-    ImageDraw = None
-    Image = None
+from photobooth.ui._pixkern import SpriteBlitter
+
+from photobooth.utils.qr_generator import QRCODE_AVAILABLE, generate_qr_array
+
+if not QRCODE_AVAILABLE:
+    generate_qr_array = None
+
+# Parsed PIL fonts shared by every OverlayRenderer: (path, size) -> FreeTypeFont
+_FONT_CACHE = {}
+
+
+@functools.lru_cache(maxsize=512)
+def _text_bbox(font, text):
+    """Memoized PIL font.getbbox(); fonts hash by identity and live for the process."""
+    return font.getbbox(text)
+
+
+@functools.lru_cache(maxsize=512)
+def _cv_text_size(text, font, scale, thickness):
+    """Memoized cv2.getTextSize() -> ((tw, th), baseline)."""
+    return cv2.getTextSize(text, font, scale, thickness)
 
 
 class OverlayRenderer:
@@ -48,547 +71,615 @@ class OverlayRenderer:
     based on current session state with cross-platform font support.
     """
 
+    # Rendered text layers, keyed by (phase, text, font_size, fill, w, h)
+    OVERLAY_CACHE_MAX = 32
+    OVERLAY_CACHE_TTL = 60.0
+    RTSP_SPRITE_CACHE_MAX = 8
+    # Per-line text sprites: countdown digits, "SMILE!", idle and gotcha lines
+    SPRITE_CACHE_MAX = 64
+    # Wrapped idle text per (backend, text, width); one entry per window size
+    WRAP_CACHE_MAX = 8
+    # Hershey stroke width for the OpenCV text fallback
+    CV_THICKNESS = 6
+    QR_CACHE_MAX = 4
+
     def __init__(self, config):
         self.font_path = config["FONT_PATH"]
         self.font_size = config["FONT_SIZE"]
         self.gotcha_text = config["OVERLAY_GOTCHA_TEXT"]
+        self._gotcha_lines = tuple(self.gotcha_text.split("\n"))
         self.idle_text = config["OVERLAY_IDLE_TEXT"]
+        self.countdown_seconds = config.get("COUNTDOWN_SECONDS", 3)
+        self.logger = logging.getLogger(__name__)
+        self._last_state_debug = 0.0
+        # PIL is only imported when the custom font exists; otherwise the
+        # OpenCV fallback is used and PIL is never loaded
+        self._PIL = None
         self.pil_font = None
-        if ImageFont is not None and os.path.exists(self.font_path):
+        # Countdown digits (2x) and the final "SMILE!" (3x) use fixed sizes;
+        # build them once rather than calling font_variant() per frame.
+        # Keyed by size multiplier; a missing variant falls back to pil_font.
+        self._font_variants = {}
+        if os.path.exists(self.font_path):
             try:
-                self.pil_font = ImageFont.truetype(self.font_path, self.font_size)
+                from PIL import ImageFont, ImageDraw, Image
+
+                key = (self.font_path, self.font_size)
+                self.pil_font = _FONT_CACHE.get(key)
+                if self.pil_font is None:
+                    self.pil_font = ImageFont.truetype(self.font_path, self.font_size)
+                    _FONT_CACHE[key] = self.pil_font
+                self._PIL = (ImageFont, ImageDraw, Image)
             except Exception:
                 self.pil_font = None
+        if self.pil_font is not None:
+            for mult in (2, 3):
+                key = (self.font_path, self.font_size * mult)
+                font = _FONT_CACHE.get(key)
+                if font is None:
+                    try:
+                        font = self.pil_font.font_variant(size=self.font_size * mult)
+                    except Exception:
+                        continue
+                    _FONT_CACHE[key] = font
+                self._font_variants[mult] = font
+        self._use_pil = self._PIL is not None
+        # Phase -> overlay renderer; anything else draws the idle overlay
+        self._phase_renderers = {
+            "smile": self._draw_smile,
+            "gotcha": self._draw_gotcha,
+            "countdown": self._draw_countdown,
+            "idle": self._draw_idle,
+        }
+        # LRU of laid-out text layers: key -> [placements, last_used]
+        self._overlay_cache = OrderedDict()
+        # Pre-rendered RTSP status boxes: (status_text, status_color) -> sprite
+        self._rtsp_sprite_cache = {}
+        # Word-wrapped idle text: (backend, text, max_width) -> lines
+        self._wrap_cache = {}
+        # OpenCV idle layer for the current (text, w, h): ([(sprite, x, y)],)
+        self._cv_idle_layout = {}
+        # In-memory QR panels: qr_url -> (qr_img, caption_box, dx, caption_th)
+        self._qr_cache = {}
+        # Per-line text sprites (PIL and OpenCV fallback) shared between layers
+        self._sprite_cache = {}
+        # Shared sprite compositor (Numba kernel or NumPy scratch fallback)
+        self._blitter = SpriteBlitter()
+
+    def prewarm(self, w, h):
+        """
+        Rasterize the countdown digits and both "SMILE!" variants for w x h frames.
+
+        Runs the normal draw path on a scratch frame so the sprite caches
+        are filled before the first countdown; safe to call again when the
+        frame size changes.
+        """
+        scratch = np.zeros((h, w, 3), dtype=np.uint8)
+        states = [
+            SimpleNamespace(phase="countdown", countdown_number=n)
+            for n in range(self.countdown_seconds, 0, -1)
+        ]
+        # countdown_number None/0 renders the final "SMILE!"
+        states.append(SimpleNamespace(phase="countdown", countdown_number=None))
+        states.append(SimpleNamespace(phase="smile", countdown_number=None))
+        for state in states:
+            self._draw_overlay_impl(scratch, state)
 
     def draw_overlay(self, frame, state):
-        # Debug: Show what state we're receiving (limit to avoid spam)
-        if (
-            not hasattr(self, "_last_state_debug")
-            or time.time() - self._last_state_debug > 2.0
-        ):
-            phase = getattr(state, "phase", "unknown")
-            countdown_number = getattr(state, "countdown_number", None)
-            # gotcha_active removed
-            print(
-                f"🎨 OverlayRenderer: phase={phase}, countdown_number={countdown_number}"
-            )
-            print(
-                f"OverlayRenderer: input frame shape={getattr(frame, 'shape', None)} state={state}"
-            )
-            self._last_state_debug = time.time()
+        # Debug: Show what state we're receiving (throttled, and skipped
+        # entirely unless DEBUG logging is enabled)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            now = time.monotonic()
+            if now - self._last_state_debug > 2.0:
+                self.logger.debug(
+                    "🎨 OverlayRenderer: phase=%s, countdown_number=%s, frame shape=%s",
+                    getattr(state, "phase", "unknown"),
+                    getattr(state, "countdown_number", None),
+                    getattr(frame, "shape", None),
+                )
+                self._last_state_debug = now
 
         result = self._draw_overlay_impl(frame, state)
-        print(
-            f"[DEBUG] _draw_overlay_impl: returned {type(result)}, shape={getattr(result, 'shape', None)}"
-        )
         if result is None:
-            print(
-                "[DEBUG] OverlayRenderer: _draw_overlay_impl returned None, falling back to original frame"
+            self.logger.warning(
+                "OverlayRenderer: _draw_overlay_impl returned None, falling back to original frame"
             )
             return frame
         return result
 
     def _draw_overlay_impl(self, frame, state):
-        print(
-            f"[DEBUG] _draw_overlay_impl: called with frame shape={getattr(frame, 'shape', None)} state={state}"
-        )
+        # One lookup per field; state may be PhotoBoothState or any object
+        # carrying a subset of these attributes
+        phase = getattr(state, "phase", None)
         h, w = frame.shape[:2]
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        thickness = 6
-        use_pil = (
-            self.pil_font is not None and ImageDraw is not None and Image is not None
+        # Unknown phases (and None) get the idle overlay
+        return self._phase_renderers.get(phase, self._draw_idle)(frame, state, w, h)
+
+    def _draw_smile(self, frame, state, w, h):
+        """Smile overlay: show whenever phase == 'smile'."""
+        smile_text = "SMILE!"
+        if self._use_pil:
+            try:
+                key = ("smile", smile_text, self.font_size, (255, 0, 0, 255), w, h)
+                layer = self._overlay_cache_get(key)
+                if layer is None:
+                    layer = self._overlay_cache_put(
+                        key,
+                        self._render_text_layer(
+                            [smile_text], self.pil_font, (255, 0, 0, 255), 4, w, h
+                        ),
+                    )
+                return self._blit_layer(frame, layer)
+            except Exception:
+                pass
+        # OpenCV fallback
+        return self._draw_cv_centered(
+            frame, smile_text, 3.0, (0, 0, 255), 6, self.CV_THICKNESS + 4, w, h
         )
 
-        # Smile overlay: show whenever phase == 'smile'
-        if getattr(state, "phase", None) == "smile":
-            smile_text = "SMILE!"
-            if use_pil:
-                try:
-                    if (
-                        self.pil_font is not None
-                        and ImageDraw is not None
-                        and Image is not None
-                    ):
-                        img_pil = Image.fromarray(frame)
-                        draw = ImageDraw.Draw(img_pil)
-                        bbox = self.pil_font.getbbox(smile_text)
-                        tw = bbox[2] - bbox[0]
-                        th = bbox[3] - bbox[1]
-                        x = (w - tw) // 2
-                        y = (h - th) // 2
-                        draw.text(
-                            (x + 4, y + 4),
-                            smile_text,
-                            font=self.pil_font,
-                            fill=(0, 0, 0, 255),
-                        )
-                        draw.text(
-                            (x, y),
-                            smile_text,
-                            font=self.pil_font,
-                            fill=(255, 0, 0, 255),
-                        )
-                        return np.array(img_pil)
-                except Exception:
-                    pass
-            # OpenCV fallback
-            scale = 3.0
-            (tw, th), _ = cv2.getTextSize(smile_text, font, scale, thickness)
-            x = (w - tw) // 2
-            y = (h + th) // 2
-            cv2.putText(
-                frame,
-                smile_text,
-                (x + 6, y + 6),
-                font,
-                scale,
-                (0, 0, 0),
-                thickness + 4,
-                cv2.LINE_AA,
-            )
-            cv2.putText(
-                frame,
-                smile_text,
-                (x, y),
-                font,
-                scale,
-                (0, 0, 255),
-                thickness,
-                cv2.LINE_AA,
-            )
-            return frame
-        # Gotcha overlay with integrated QR code: show when phase == 'gotcha'
-        if getattr(state, "phase", None) == "gotcha":
-            lines = self.gotcha_text.split("\n")
-            pil_success = False
-            if use_pil:
-                try:
-                    if (
-                        self.pil_font is not None
-                        and ImageDraw is not None
-                        and Image is not None
-                    ):
-                        img_pil = Image.fromarray(frame)
-                        draw = ImageDraw.Draw(img_pil)
-                        line_heights = [
-                            self.pil_font.getbbox(line)[3]
-                            - self.pil_font.getbbox(line)[1]
-                            for line in lines
-                        ]
-                        total_height = sum(line_heights)
-                        y = (h - total_height) // 2
-                        for line in lines:
-                            bbox = self.pil_font.getbbox(line)
-                            tw = bbox[2] - bbox[0]
-                            th = bbox[3] - bbox[1]
-                            x = (w - tw) // 2
-                            draw.text(
-                                (x + 4, y + 4),
-                                line,
-                                font=self.pil_font,
-                                fill=(0, 0, 0, 255),
-                            )
-                            draw.text(
-                                (x, y),
-                                line,
-                                font=self.pil_font,
-                                fill=(0, 0, 255, 255),
-                            )
-                            y += th
-                        frame = np.array(img_pil)
-                        pil_success = True
-                except Exception:
-                    pil_success = False
-            if not pil_success:
-                scale = 2.5
-                line_sizes = [
-                    cv2.getTextSize(line, font, scale, thickness)[0] for line in lines
-                ]
-                total_height = sum([size[1] for size in line_sizes])
-                y = (h - total_height) // 2
-                for line in lines:
-                    (tw, th), _ = cv2.getTextSize(line, font, scale, thickness)
-                    x = (w - tw) // 2
-                    cv2.putText(
-                        frame,
-                        line,
-                        (x + 4, y + th + 4),
-                        font,
-                        scale,
-                        (0, 0, 0),
-                        thickness + 2,
-                        cv2.LINE_AA,
+    def _draw_gotcha(self, frame, state, w, h):
+        """Gotcha overlay with integrated QR code: show when phase == 'gotcha'."""
+        lines = self._gotcha_lines
+        pil_success = False
+        if self._use_pil:
+            try:
+                key = (
+                    "gotcha",
+                    self.gotcha_text,
+                    self.font_size,
+                    (0, 0, 255, 255),
+                    w,
+                    h,
+                )
+                layer = self._overlay_cache_get(key)
+                if layer is None:
+                    layer = self._overlay_cache_put(
+                        key,
+                        self._render_text_layer(
+                            lines, self.pil_font, (0, 0, 255, 255), 4, w, h
+                        ),
                     )
-                    cv2.putText(
-                        frame,
-                        line,
-                        (x, y + th),
-                        font,
-                        scale,
-                        (0, 0, 255),
-                        thickness,
-                        cv2.LINE_AA,
+                frame = self._blit_layer(frame, layer)
+                pil_success = True
+            except Exception:
+                pil_success = False
+        if not pil_success:
+            key = ("cv-gotcha", self.gotcha_text, w, h)
+            layer = self._overlay_cache_get(key)
+            if layer is None:
+                thickness = self.CV_THICKNESS
+                # Each sprite carries its own (tw, th), measured once when built
+                sprites = [
+                    self._cv_text_sprite(
+                        line, 2.5, (0, 0, 255), thickness, 4, thickness + 2
                     )
-                    y += th
-            if getattr(state, "qr_url", None):
-                frame = self._draw_qr_overlay(frame, getattr(state, "qr_url", None))
-            return frame
+                    for line in lines
+                ]
+                placements = []
+                y = (h - sum(sprite[5] for sprite in sprites)) // 2
+                for sprite in sprites:
+                    x = (w - sprite[4]) // 2
+                    y += sprite[5]  # baseline sits one line-height below the top
+                    placements.append((sprite, x + sprite[2], y + sprite[3]))
+                layer = self._overlay_cache_put(key, [placements, time.monotonic()])
+            frame = self._blit_layer(frame, layer)
+        qr_url = getattr(state, "qr_url", None)
+        if qr_url:
+            frame = self._draw_qr_overlay(frame, qr_url)
+        return frame
 
-        # Idle overlay
-        if getattr(state, "phase", None) != "countdown":
-            print("[DEBUG] _draw_overlay_impl: idle overlay path")
-            blink_period = 4.0
-            blink_on = 3.0
-            t = time.time() % blink_period
-            if t < blink_on:
-                text = self.idle_text
-                scale = 2.0
-                pil_success = False
-                if use_pil:
-                    try:
-                        if (
-                            self.pil_font is not None
-                            and ImageDraw is not None
-                            and Image is not None
-                        ):
-                            img_pil = Image.fromarray(frame)
-                            draw = ImageDraw.Draw(img_pil)
-                            max_width = int(w * 0.95)
-                            words = text.split()
-                            lines = []
-                            current = words[0]
-                            for word in words[1:]:
-                                test_line = current + " " + word
-                                bbox = self.pil_font.getbbox(test_line)
-                                tw = bbox[2] - bbox[0]
-                                if tw > max_width:
-                                    lines.append(current)
-                                    current = word
-                                else:
-                                    current = test_line
-                            lines.append(current)
-                            total_height = sum(
-                                self.pil_font.getbbox(line)[3]
-                                - self.pil_font.getbbox(line)[1]
-                                for line in lines
-                            )
-                            y = (h - total_height) // 2
-                            for line in lines:
-                                bbox = self.pil_font.getbbox(line)
-                                tw = bbox[2] - bbox[0]
-                                th = bbox[3] - bbox[1]
-                                x = (w - tw) // 2
-                                draw.text(
-                                    (x + 3, y + 3),
-                                    line,
-                                    font=self.pil_font,
-                                    fill=(0, 0, 0, 255),
-                                )
-                                draw.text(
-                                    (x, y),
-                                    line,
-                                    font=self.pil_font,
-                                    fill=(0, 0, 255, 255),
-                                )
-                                y += th
-                            print(
-                                "[DEBUG] _draw_overlay_impl: idle overlay PIL path returning image"
-                            )
-                            return np.array(img_pil)
-                            pil_success = True
-                    except Exception:
-                        pil_success = False
-                if not pil_success:
-                    # OpenCV fallback
-                    max_width = int(w * 0.95)
-                    words = text.split()
-                    lines = []
-                    current = words[0]
-                    for word in words[1:]:
-                        test_line = current + " " + word
-                        (tw, th), _ = cv2.getTextSize(test_line, font, 1.0, thickness)
-                        if tw > max_width:
-                            lines.append(current)
-                            current = word
-                        else:
-                            current = test_line
-                    lines.append(current)
-                    scale = 1.5
-                    line_sizes = [
-                        cv2.getTextSize(line, font, scale, thickness)[0]
-                        for line in lines
-                    ]
-                    total_height = sum([size[1] for size in line_sizes])
-                    y = (h - total_height) // 2
-                    for line in lines:
-                        (tw, th), _ = cv2.getTextSize(line, font, scale, thickness)
-                        x = (w - tw) // 2
-                        cv2.putText(
-                            frame,
-                            line,
-                            (x + 3, y + th + 3),
-                            font,
-                            scale,
-                            (0, 0, 0),
-                            thickness + 2,
-                            cv2.LINE_AA,
-                        )
-                        cv2.putText(
-                            frame,
-                            line,
-                            (x, y + th),
-                            font,
-                            scale,
-                            (0, 0, 255),
-                            thickness,
-                            cv2.LINE_AA,
-                        )
-                        y += th
-                    # Debug print removed for normal operation
-                    return frame
-                else:
-                    (tw, th), _ = cv2.getTextSize(text, font, scale, thickness)
-                    x = (w - tw) // 2
-                    y = (h + th) // 2
-                    cv2.putText(
-                        frame,
-                        text,
-                        (x + 3, y + 3),
-                        font,
-                        scale,
-                        (0, 0, 0),
-                        thickness + 2,
-                        cv2.LINE_AA,
+    def _draw_idle(self, frame, state, w, h):
+        """Idle overlay: blinking, word-wrapped instructions."""
+        # Blink: text is hidden for the last second of every 4 s period.
+        # Test this first so hidden frames skip all text setup.
+        if time.monotonic() % 4.0 >= 3.0:
+            return frame
+        text = self.idle_text
+        if self._use_pil:
+            try:
+                key = ("idle", text, self.font_size, (0, 0, 255, 255), w, h)
+                layer = self._overlay_cache_get(key)
+                if layer is None:
+                    lines = self._wrap_text(
+                        "pil", text, int(w * 0.95), self._pil_text_width
                     )
-                    cv2.putText(
-                        frame,
-                        text,
-                        (x, y),
-                        font,
-                        scale,
-                        (0, 0, 255),
-                        thickness,
-                        cv2.LINE_AA,
+                    layer = self._overlay_cache_put(
+                        key,
+                        self._render_text_layer(
+                            lines, self.pil_font, (0, 0, 255, 255), 3, w, h
+                        ),
                     )
-                    # Debug print removed for normal operation
-                    return frame
-            # Debug print removed for normal operation
-            return frame
+                return self._blit_layer(frame, layer)
+            except Exception:
+                pass
+        # OpenCV fallback
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        thickness = self.CV_THICKNESS
+        scale = 1.5
+        layout_key = (text, w, h)
+        layout = self._cv_idle_layout.get(layout_key)
+        if layout is None:
+            lines = self._wrap_text(
+                "cv",
+                text,
+                int(w * 0.95),
+                lambda s: _cv_text_size(s, font, 1.0, thickness)[0][0],
+            )
+            line_sizes = [
+                _cv_text_size(line, font, scale, thickness)[0] for line in lines
+            ]
+            total_height = sum([size[1] for size in line_sizes])
+            y = (h - total_height) // 2
+            # Resolve each line to its sprite and final ROI origin up front,
+            # so visible frames go straight to compositing
+            placements = []
+            for line, (tw, th) in zip(lines, line_sizes):
+                sprite = self._cv_text_sprite(
+                    line, scale, (0, 0, 255), thickness, 3, thickness + 2
+                )
+                x, baseline = (w - tw) // 2, y + th
+                placements.append((sprite, x + sprite[2], baseline + sprite[3]))
+                y += th
+            layout = (placements,)
+            self._cv_idle_layout = {layout_key: layout}
+        self._blit_layer(frame, layout)
+        return frame
 
-        # Countdown overlay (phase == 'countdown')
+    def _draw_countdown(self, frame, state, w, h):
+        """Countdown overlay: large digit, then "SMILE!" when it reaches zero."""
         seconds_left = getattr(state, "countdown_number", None)
-        pil_success = False
-        if use_pil:
+        counting = seconds_left is not None and seconds_left > 0
+        text = str(seconds_left) if counting else "SMILE!"
+        if self._use_pil:
             try:
-                if (
-                    self.pil_font is not None
-                    and ImageDraw is not None
-                    and Image is not None
-                ):
-                    img_pil = Image.fromarray(frame)
-                    draw = ImageDraw.Draw(img_pil)
-                    if seconds_left is not None and seconds_left > 0:
-                        text = str(seconds_left)
-                        font_size = self.pil_font.size * 2
-                        color = (0, 0, 255, 255)
-                    else:
-                        text = "SMILE!"
-                        font_size = self.pil_font.size * 3
-                        color = (0, 0, 255, 255)
-                    try:
-                        font_for_count = self.pil_font.font_variant(size=font_size)
-                    except Exception:
-                        font_for_count = self.pil_font
-                    bbox = font_for_count.getbbox(text)
-                    tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-                    x = (w - tw) // 2
-                    y = (h - th) // 2
-                    draw.text(
-                        (x + 4, y + 4),
-                        text,
-                        font=font_for_count,
-                        fill=(0, 0, 0, 255),
+                font_for_count = self._font_variants.get(
+                    2 if counting else 3, self.pil_font
+                )
+                color = (0, 0, 255, 255)
+                key = ("countdown", text, font_for_count.size, color, w, h)
+                layer = self._overlay_cache_get(key)
+                if layer is None:
+                    layer = self._overlay_cache_put(
+                        key,
+                        self._render_text_layer([text], font_for_count, color, 4, w, h),
                     )
-                    draw.text((x, y), text, font=font_for_count, fill=color)
-                    pil_success = True
-                    return np.array(img_pil)
+                return self._blit_layer(frame, layer)
             except Exception:
-                pil_success = False
-        if not pil_success:
-            # OpenCV fallback
-            if seconds_left is not None and seconds_left > 0:
-                text = str(seconds_left)
-                scale = 4.0
-                color = (0, 0, 255)
-            else:
-                text = "SMILE!"
-                scale = 5.0
-                color = (0, 0, 255)
-            (tw, th), _ = cv2.getTextSize(text, font, scale, thickness)
-            x = (w - tw) // 2
-            y = (h + th) // 2
-            cv2.putText(
-                frame,
-                text,
-                (x + 4, y + 4),
-                font,
-                scale,
-                (0, 0, 0),
-                thickness + 4,
-                cv2.LINE_AA,
-            )
-            cv2.putText(frame, text, (x, y), font, scale, color, thickness, cv2.LINE_AA)
-            return frame
-        else:
-            if seconds_left is None or seconds_left <= 0:
-                text = "SMILE!"
-                scale = 3.0
+                pass
+        # OpenCV fallback
+        return self._draw_cv_centered(
+            frame,
+            text,
+            4.0 if counting else 5.0,
+            (0, 0, 255),
+            4,
+            self.CV_THICKNESS + 4,
+            w,
+            h,
+        )
+
+    def _draw_cv_centered(
+        self, frame, text, scale, color, shadow, shadow_thickness, w, h
+    ):
+        """Draw one Hershey line centered on the frame (baseline at (h + th) // 2)."""
+        sprite = self._cv_text_sprite(
+            text, scale, color, self.CV_THICKNESS, shadow, shadow_thickness
+        )
+        x = (w - sprite[4]) // 2
+        y = (h + sprite[5]) // 2
+        self._blit_sprite(frame, sprite, x + sprite[2], y + sprite[3])
+        return frame
+
+    def _pil_text_width(self, text):
+        bbox = _text_bbox(self.pil_font, text)
+        return bbox[2] - bbox[0]
+
+    def _wrap_text(self, tag, text, max_width, measure):
+        """
+        Greedy word-wrap of text to max_width, memoized per (tag, text, max_width).
+
+        measure(str) -> width in pixels; tag separates backends whose
+        measurements differ (PIL font vs OpenCV Hershey).
+        """
+        key = (tag, text, max_width)
+        lines = self._wrap_cache.get(key)
+        if lines is not None:
+            return lines
+        words = text.split()
+        lines = []
+        current = words[0]
+        for word in words[1:]:
+            test_line = current + " " + word
+            if measure(test_line) > max_width:
+                lines.append(current)
+                current = word
             else:
-                text = str(seconds_left)
-                scale = 5.0
-            (tw, th), _ = cv2.getTextSize(text, font, scale, thickness)
-            x = (w - tw) // 2
-            y = (h + th) // 2
-            cv2.putText(
-                frame,
-                text,
-                (x + 4, y + 4),
-                font,
-                scale,
-                (0, 0, 0),
-                thickness + 2,
-                cv2.LINE_AA,
-            )
-            cv2.putText(
-                frame,
-                text,
-                (x, y),
-                font,
-                scale,
-                (255, 255, 255),
-                thickness,
-                cv2.LINE_AA,
-            )
-            return frame
+                current = test_line
+        lines.append(current)
+        lines = tuple(lines)
+        if len(self._wrap_cache) >= self.WRAP_CACHE_MAX:
+            del self._wrap_cache[next(iter(self._wrap_cache))]
+        self._wrap_cache[key] = lines
+        return lines
+
+    def _overlay_cache_get(self, key):
+        """Return a cached text layer and mark it most-recently used, or None."""
+        layer = self._overlay_cache.get(key)
+        if layer is None:
+            return None
+        now = time.monotonic()
+        if now - layer[1] > self.OVERLAY_CACHE_TTL:
+            del self._overlay_cache[key]
+            return None
+        layer[1] = now
+        self._overlay_cache.move_to_end(key)
+        return layer
+
+    def _overlay_cache_put(self, key, layer):
+        """Store a freshly rendered layer, evicting the least-recently used."""
+        self._overlay_cache[key] = layer
+        while len(self._overlay_cache) > self.OVERLAY_CACHE_MAX:
+            self._overlay_cache.popitem(last=False)
+        return layer
+
+    def _render_text_layer(self, lines, font, fill, shadow, w, h):
+        """
+        Lay out centered lines and resolve each to a cached per-line sprite.
+
+        Layout matches the old whole-frame PIL drawing exactly. Returns
+        [placements, last_used] where placements is [(sprite, x, y), ...].
+        """
+        placements = []
+        sprites = [self._render_text_sprite(line, font, fill, shadow) for line in lines]
+        y = (h - sum(sp[5] for sp in sprites)) // 2
+        for sprite in sprites:
+            x = (w - sprite[4]) // 2
+            # Sprite origin is the glyph bbox corner, not the draw position
+            placements.append((sprite, x + sprite[2], y + sprite[3]))
+            y += sprite[5]
+        return [placements, time.monotonic()]
+
+    def _render_text_sprite(self, text, font, fill, shadow):
+        """
+        Rasterize one line (shadow + fill) into a small premultiplied sprite.
+
+        Returns (premul, inv_alpha, dx, dy, tw, th): premultiplied colour
+        and inverse alpha as float32, the bbox offset from the PIL draw
+        position, and the text bbox size used for layout. Fill tuples are
+        written straight into the frame's channel order, as before.
+
+        The glyphs are rasterized once as a coverage mask; the shadow is the
+        same mask shifted by the (integer) shadow offset. The two are fused
+        here ("fill over black shadow"), so one blit composites both layers.
+        Drawing both into one RGBA image instead would let PIL blend the
+        fill's edges against the shadow's straight colour and darken them.
+        """
+        key = (text, font.size, fill, shadow)
+        sprite = self._sprite_cache.get(key)
+        if sprite is not None:
+            return sprite
+
+        bbox = _text_bbox(font, text)
+        tw = bbox[2] - bbox[0]
+        th = bbox[3] - bbox[1]
+        size = (max(tw + shadow, 1), max(th + shadow, 1))
+        _, ImageDraw, Image = self._PIL
+        text_mask = Image.new("L", size)
+        ImageDraw.Draw(text_mask).text((-bbox[0], -bbox[1]), text, font=font, fill=255)
+
+        mt = np.asarray(text_mask, dtype=np.float32)[..., None] / 255.0
+        ms = np.zeros_like(mt)
+        ms[shadow:, shadow:] = mt[: size[1] - shadow, : size[0] - shadow]
+        alpha = mt + ms * (1.0 - mt)
+        # +0.5 makes the uint8 store in _blit_sprite round instead of truncate
+        premul = mt * np.asarray(fill[:3], dtype=np.float32) + 0.5
+        sprite = (premul, 1.0 - alpha, bbox[0], bbox[1], tw, th)
+        self._store_sprite(key, sprite)
+        return sprite
+
+    def _store_sprite(self, key, sprite):
+        """Cache a text sprite, evicting the oldest entry once the cache is full."""
+        if len(self._sprite_cache) >= self.SPRITE_CACHE_MAX:
+            del self._sprite_cache[next(iter(self._sprite_cache))]
+        self._sprite_cache[key] = sprite
+
+    def _cv_text_sprite(self, text, scale, color, thickness, shadow, shadow_thickness):
+        """
+        Rasterize an OpenCV shadow + text pair once into a premultiplied sprite.
+
+        The colour canvas starts black, so anti-aliased text drawn on it is
+        already premultiplied; the mask receives both strokes, which
+        putText's AA blending accumulates as "text over shadow" coverage.
+        Same tuple layout as _render_text_sprite, so _blit_sprite serves both.
+        """
+        key = ("cv", text, scale, color, thickness, shadow, shadow_thickness)
+        sprite = self._sprite_cache.get(key)
+        if sprite is not None:
+            return sprite
+
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        (tw, th), baseline = _cv_text_size(text, font, scale, thickness)
+        pad = shadow_thickness
+        sw = tw + 2 * pad + shadow
+        sh = th + baseline + 2 * pad + shadow
+        ox, oy = pad, pad + th
+        canvas = np.zeros((sh, sw, 3), dtype=np.uint8)
+        mask = np.zeros((sh, sw), dtype=np.uint8)
+        cv2.putText(
+            mask,
+            text,
+            (ox + shadow, oy + shadow),
+            font,
+            scale,
+            255,
+            shadow_thickness,
+            cv2.LINE_AA,
+        )
+        cv2.putText(mask, text, (ox, oy), font, scale, 255, thickness, cv2.LINE_AA)
+        cv2.putText(canvas, text, (ox, oy), font, scale, color, thickness, cv2.LINE_AA)
+
+        alpha = mask[..., None].astype(np.float32) / 255.0
+        # +0.5 makes the uint8 store in _blit_sprite round instead of truncate
+        premul = canvas.astype(np.float32) + 0.5
+        sprite = (premul, 1.0 - alpha, -ox, -oy, tw, th)
+        self._store_sprite(key, sprite)
+        return sprite
+
+    def _blit_layer(self, frame, layer):
+        """Composite every line sprite of a cached layer onto frame, in place."""
+        for sprite, x, y in layer[0]:
+            self._blit_sprite(frame, sprite, x, y)
         return frame
 
+    def _blit_sprite(self, frame, sprite, x0, y0):
+        """Alpha-composite one sprite onto its ROI of frame, clipped to bounds."""
+        self._blitter.blit(frame, sprite[0], sprite[1], x0, y0)
+
     def draw_rtsp_status(self, frame, status_text, status_color):
         """
         Draws a small overlay in the lower right corner with RTSP status.
         status_text: 'RTSP Connecting', 'ONLINE', 'OFFLINE', etc.
         status_color: (0,255,0) for green, (0,0,255) for red, etc.
-        """
-        import cv2
 
+        The box is opaque, so it is rendered once per (text, color) into a
+        small sprite and copied into the corner on subsequent frames.
+        """
         h, w = frame.shape[:2]
         pad = 16
+        key = (status_text, tuple(status_color))
+        sprite = self._rtsp_sprite_cache.get(key)
+        if sprite is None:
+            sprite = self._render_rtsp_sprite(status_text, status_color)
+            # Status changes are rare; keep a handful of states, evict FIFO
+            if len(self._rtsp_sprite_cache) >= self.RTSP_SPRITE_CACHE_MAX:
+                del self._rtsp_sprite_cache[next(iter(self._rtsp_sprite_cache))]
+            self._rtsp_sprite_cache[key] = sprite
+        box, th, inner_pad = sprite
+        box_h, box_w = box.shape[:2]
+        y = h - pad
+        # Same anchor as the original drawing: right edge at w - 10,
+        # top edge at y - th - inner_pad (rectangle corners are inclusive)
+        x0 = w - 10 - (box_w - 1)
+        y0 = y - th - inner_pad
+        self._paste_opaque(frame, box, x0, y0)
+        return frame
+
+    def _render_rtsp_sprite(self, status_text, status_color):
+        """Draw the RTSP status box (background, dot, text) in local coordinates."""
         font = cv2.FONT_HERSHEY_SIMPLEX
         # Reduce font size to about half for a compact indicator
         font_scale = 0.4
         thickness = 1
-        text = status_text
-        (tw, th), _ = cv2.getTextSize(text, font, font_scale, thickness)
-        y = h - pad
+        (tw, th), _ = cv2.getTextSize(status_text, font, font_scale, thickness)
         # Layout: compute total box width including dot + spacing + text + inner padding
         dot_radius = 6
         spacing = 8
         inner_pad = 10
         total_box_width = (dot_radius * 2) + spacing + tw + (inner_pad * 2)
-        box_right = w - 10
-        box_left = box_right - total_box_width
-        # Draw background rectangle
-        cv2.rectangle(
-            frame,
-            (int(box_left), int(y - th - inner_pad)),
-            (int(box_right), int(y + inner_pad)),
-            (30, 30, 30),
-            -1,
+        # Background rectangle fills the whole sprite
+        box = np.full(
+            (th + 2 * inner_pad + 1, total_box_width + 1, 3), 30, dtype=np.uint8
         )
+        baseline_y = th + inner_pad
         # Dot position (left inside box)
-        dot_x = int(box_left + inner_pad + dot_radius)
-        dot_y = int(y - th // 2)
-        cv2.circle(frame, (dot_x, dot_y), dot_radius, status_color, -1)
+        dot_x = inner_pad + dot_radius
+        dot_y = baseline_y - th // 2
+        cv2.circle(box, (dot_x, dot_y), dot_radius, status_color, -1)
         # Text position (to the right of the dot)
-        text_x = int(box_left + inner_pad + (dot_radius * 2) + spacing)
+        text_x = inner_pad + (dot_radius * 2) + spacing
         cv2.putText(
-            frame,
-            text,
-            (text_x, y),
+            box,
+            status_text,
+            (text_x, baseline_y),
             font,
             font_scale,
             status_color,
             thickness,
             cv2.LINE_AA,
         )
-        return frame
+        return box, th, inner_pad
 
     def _draw_qr_overlay(self, frame, qr_url):
         """Draw QR code in upper right corner with 'Scan for Photos' caption."""
+        if generate_qr_array is None:
+            return frame
         try:
-            from photobooth.utils.qr_generator import generate_qr
-            import tempfile
-            import os
-
             h, w = frame.shape[:2]
 
-            # Generate QR code to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                qr_path = tmp.name
-
-            generate_qr(qr_url, qr_path, size=6)  # Smaller size for corner display
-            qr_img = cv2.imread(qr_path)
-
-            if qr_img is not None:
-                qr_h, qr_w = qr_img.shape[:2]
-
-                # Position in upper right with padding
-                margin = 20
-                qr_x = w - qr_w - margin
-                qr_y = margin
-
-                # Ensure QR code fits on screen
-                if qr_x > 0 and qr_y + qr_h < h:
-                    # Overlay QR code
-                    frame[qr_y : qr_y + qr_h, qr_x : qr_x + qr_w] = qr_img
-
-                    # Add caption below QR code
-                    caption = "Scan for Photos"
-                    font = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = 0.6
-                    thickness = 2
-                    (tw, th), _ = cv2.getTextSize(caption, font, font_scale, thickness)
-
-                    # Center caption under QR code
-                    caption_x = qr_x + (qr_w - tw) // 2
-                    caption_y = qr_y + qr_h + th + 10
-
-                    if caption_y < h - 10:  # Ensure caption fits
-                        # Caption background
-                        cv2.rectangle(
-                            frame,
-                            (caption_x - 5, caption_y - th - 5),
-                            (caption_x + tw + 5, caption_y + 5),
-                            (0, 0, 0),
-                            -1,
-                        )
-                        # Caption text
-                        cv2.putText(
-                            frame,
-                            caption,
-                            (caption_x, caption_y),
-                            font,
-                            font_scale,
-                            (255, 255, 255),
-                            thickness,
-                            cv2.LINE_AA,
-                        )
-
-            # Clean up temp file
-            try:
-                os.unlink(qr_path)
-            except Exception:
-                pass
+            cached = self._qr_cache.get(qr_url)
+            if cached is None:
+                cached = self._render_qr_panel(qr_url)
+                # One URL per session; keep just the last few
+                if len(self._qr_cache) >= self.QR_CACHE_MAX:
+                    self._qr_cache.clear()
+                self._qr_cache[qr_url] = cached
+            qr_img, caption_box, caption_dx, caption_th = cached
+
+            qr_h, qr_w = qr_img.shape[:2]
+
+            # Position in upper right with padding
+            margin = 20
+            qr_x = w - qr_w - margin
+            qr_y = margin
+
+            # Ensure QR code fits on screen
+            if qr_x > 0 and qr_y + qr_h < h:
+                # Overlay QR code
+                frame[qr_y : qr_y + qr_h, qr_x : qr_x + qr_w] = qr_img
+
+                # Caption below QR code, baseline th + 10 under it
+                caption_y = qr_y + qr_h + caption_th + 10
+                if caption_y < h - 10:  # Ensure caption fits
+                    self._paste_opaque(
+                        frame,
+                        caption_box,
+                        qr_x + caption_dx,
+                        caption_y - caption_th - 5,
+                    )
         except Exception:
             # Silently fail if QR generation doesn't work
             pass
         return frame
+
+    def _render_qr_panel(self, qr_url):
+        """
+        Build the QR image and its caption box once per URL, entirely in memory.
+
+        Returns (qr_img, caption_box, caption_dx, caption_th): caption_dx is
+        the box's x offset from the QR's left edge and caption_th the text
+        height used to place it.
+        """
+        qr_img = generate_qr_array(qr_url, size=6)  # Smaller size for corner display
+        qr_w = qr_img.shape[1]
+
+        caption = "Scan for Photos"
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        font_scale = 0.6
+        thickness = 2
+        (tw, th), _ = cv2.getTextSize(caption, font, font_scale, thickness)
+
+        # Caption background (black, 5px padding), text baseline at th + 5
+        caption_box = np.zeros((th + 11, tw + 11, 3), dtype=np.uint8)
+        cv2.putText(
+            caption_box,
+            caption,
+            (5, th + 5),
+            font,
+            font_scale,
+            (255, 255, 255),
+            thickness,
+            cv2.LINE_AA,
+        )
+        # Center caption under QR code
+        caption_dx = (qr_w - tw) // 2 - 5
+        return qr_img, caption_box, caption_dx, th
+
+    @staticmethod
+    def _paste_opaque(frame, img, x0, y0):
+        """Copy img into frame with its top-left at (x0, y0), clipped to bounds."""
+        h, w = frame.shape[:2]
+        ih, iw = img.shape[:2]
+        x1, y1 = max(x0, 0), max(y0, 0)
+        x2, y2 = min(x0 + iw, w), min(y0 + ih, h)
+        if x1 < x2 and y1 < y2:
+            frame[y1:y2, x1:x2] = img[y1 - y0 : y2 - y0, x1 - x0 : x2 - x0]
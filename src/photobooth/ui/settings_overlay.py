@@ -5,56 +5,53 @@ Handles visual overlay display for camera settings adjustments
 
 import time
 import cv2
+import numpy as np
+
+from photobooth.ui._pixkern import SpriteBlitter
 
 
 class SettingsOverlay:
+    # Rasterized text lines, keyed by (text, color)
+    TEXT_SPRITE_CACHE_MAX = 32
+    # 0.7x dim as a byte lookup table, built with addWeighted so its
+    # rounding matches the original full-frame blend exactly
+    _DIM_LUT = cv2.addWeighted(
+        np.arange(256, dtype=np.uint8), 0.7, np.zeros(256, np.uint8), 0.3, 0
+    ).ravel()
+
     def __init__(self, duration=3.0):
         self.duration = duration
-        self.timer = 0
+        # time.monotonic() deadline; 0 means never shown
+        self._expiry = 0.0
         self.last_change = ""
         self.current_settings = {}
+        self._text_sprites = {}
+        # Same sprite compositor OverlayRenderer uses for its text sprites
+        self._blitter = SpriteBlitter()
 
     def show_setting_change(self, setting_name, display_value):
         """Trigger overlay display for a setting change."""
         self.last_change = f"🎛️ {setting_name}: {display_value}"
-        self.timer = time.time()
-
-    def update_current_settings(
-        self,
-        wb_mode,
-        wb_modes,
-        brightness,
-        contrast,
-        saturation,
-        exposure,
-        gain,
-        noise_reduction,
-    ):
-        """Update the current settings display."""
-        self.current_settings = {
-            "wb_mode": wb_mode,
-            "wb_modes": wb_modes,
-            "brightness": brightness,
-            "contrast": contrast,
-            "saturation": saturation,
-            "exposure": exposure,
-            "gain": gain,
-            "noise_reduction": noise_reduction,
-        }
+        self._expiry = time.monotonic() + self.duration
+
+    def update_current_settings(self, **changes):
+        """Merge changed settings (wb_mode, brightness, ...) into the display."""
+        self.current_settings.update(changes)
 
     def is_visible(self):
         """Check if overlay should be visible."""
-        return self.timer > 0 and time.time() - self.timer < self.duration
+        return time.monotonic() < self._expiry
 
     def draw_overlay(self, frame):
         """Draw settings overlay on frame if visible."""
         if not self.is_visible():
             return frame
 
-        # Semi-transparent overlay background
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (10, 10), (650, 120), (0, 0, 0), -1)
-        frame = cv2.addWeighted(frame, 0.7, overlay, 0.3, 0)
+        # Semi-transparent background: dim only the panel (10,10)-(650,120)
+        # in place; blending the whole frame left everything else unchanged
+        roi = frame[10:121, 10:651]
+        if roi.size:
+            cv2.LUT(roi, self._DIM_LUT, dst=roi)
 
         # Current settings text
         settings = self.current_settings
@@ -77,14 +74,43 @@ class SettingsOverlay:
             color = (
                 (0, 255, 255) if i == 2 else (255, 255, 255)
             )  # Highlight last change
-            cv2.putText(
-                frame,
-                text,
-                (15, y_offset + i * 25),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
-                color,
-                2,
-            )
+            self._draw_text(frame, text, 15, y_offset + i * 25, color)
 
         return frame
+
+    def _draw_text(self, frame, text, x, y, color):
+        """Blend the cached sprite for text at putText origin (x, y), clipped to frame."""
+        if not text:
+            return
+        key = (text, color)
+        sprite = self._text_sprites.get(key)
+        if sprite is None:
+            sprite = self._render_text_sprite(text, color)
+            if len(self._text_sprites) >= self.TEXT_SPRITE_CACHE_MAX:
+                del self._text_sprites[next(iter(self._text_sprites))]
+            self._text_sprites[key] = sprite
+        premul, inv_alpha, dx, dy = sprite
+        self._blitter.blit(frame, premul, inv_alpha, x + dx, y + dy)
+
+    @staticmethod
+    def _render_text_sprite(text, color):
+        """
+        Rasterize one line once into a premultiplied sprite.
+
+        putText's anti-aliased edges are captured by drawing the colour onto
+        a black canvas (already premultiplied) and the coverage into a mask.
+        Returns (premul, inv_alpha, dx, dy), (dx, dy) being the sprite's
+        offset from the putText origin.
+        """
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        (tw, th), baseline = cv2.getTextSize(text, font, 0.6, 2)
+        pad = 2  # stroke half-width plus rounding
+        size = (th + baseline + 2 * pad, tw + 2 * pad)
+        canvas = np.zeros(size + (3,), dtype=np.uint8)
+        mask = np.zeros(size, dtype=np.uint8)
+        cv2.putText(canvas, text, (pad, pad + th), font, 0.6, color, 2)
+        cv2.putText(mask, text, (pad, pad + th), font, 0.6, 255, 2)
+        # +0.5 makes the uint8 store round instead of truncate
+        premul = canvas.astype(np.float32) + 0.5
+        inv_alpha = 1.0 - mask[..., None].astype(np.float32) / 255.0
+        return premul, inv_alpha, -pad, -pad - th
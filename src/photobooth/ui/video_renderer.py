@@ -2,7 +2,7 @@
 VideoRenderer - Pure video frame rendering and display
 
 This class handles:
-- Getting camera frames
+- Getting camera frames (optionally on a background capture thread)
 - Reading current display state from ThreadSafeDisplayState
 - Rendering overlays based on state
 - Displaying frames in OpenCV window
@@ -13,8 +13,13 @@ This is extracted from ActionHandler to create clean separation of concerns.
 
 import cv2
 import time
+import logging
+import operator
+import numpy as np
 from typing import Optional
 
+from photobooth.managers.camera_manager import ThreadedFrameSource
+
 
 class VideoRenderer:
     """
@@ -40,51 +45,154 @@ class VideoRenderer:
         self.camera_controls = camera_controls
         self.settings_overlay = settings_overlay
         self.input_handler = input_handler
+        self.logger = logging.getLogger(__name__)
+        # Phase last reported by the state debug log (logged on change only)
+        self._last_logged_phase = None
+        # Display-state fields read every frame, fetched in one C-level call
+        self._state_getter = operator.attrgetter(
+            "phase", "gotcha_active", "countdown_number", "qr_data"
+        )
 
         # Window configuration
         self.window_name = config.get("PREVIEW_WINDOW", "PhotoBooth Preview")
         self.preview_enabled = config.get("PREVIEW_ENABLED", True)
 
+        # Mirror destination, reused across frames (overlays draw into it)
+        self._flip_buf = None
+        # Camera already delivers mirrored frames (sensor-side hflip)
+        self._sensor_mirrored = getattr(camera_manager, "mirrored", False)
+
+        # OpenCV >= 4.1 pollKey returns immediately; waitKey(1) may sleep ~1 ms
+        # (and much longer on some Windows/macOS backends)
+        self._poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+
+        # Optional ThreadedFrameSource: keeps only the newest camera frame in
+        # a single slot so capture overlaps overlay/display work
+        self._frame_source = None
+
+        # Overlay state handed to draw_overlay, refilled in place each frame
+        self._overlay_state = {
+            "phase": None,
+            "countdown_active": False,
+            "gotcha_active": False,
+            "countdown_number": 0,
+            "qr_url": None,
+        }
+
+        # Session keys routed to the InputHandler; other keys go to the
+        # camera controls while idle
+        self._key_commands = {ord("q"): "quit", ord(" "): "button", ord("s"): "status"}
+
+        # Last displayed (raw frame, state) and whether it had the settings
+        # overlay, for skipping re-renders of an identical composite
+        self._last_raw = None
+        self._last_sig = None
+        self._settings_shown = False
+
+        # Preview window is created on the first rendered frame
+        self._window_ready = False
+
+        # Headless: shadow render_frame with a no-op so the loop pays no
+        # per-call preview check
+        if not self.preview_enabled:
+            self.render_frame = self._render_disabled
+
+    def _render_disabled(self) -> Optional[str]:
+        return None
+
     def render_frame(self) -> Optional[str]:
         """
         Render one frame: get camera frame, apply overlays, display window.
 
         Returns:
-            str: Key pressed ('q' for quit, 'space' for button, etc.) or None
+            str: 'quit' if the InputHandler requested quit, otherwise None
         """
-        if not self.preview_enabled:
-            return None
-
-        # Get camera frame
-        frame = self.camera_manager.get_frame()
+        # Get camera frame (newest captured one when the capture thread runs)
+        if self._frame_source is not None:
+            frame, _ = self._frame_source.read()
+        else:
+            frame = self.camera_manager.get_frame()
         if frame is None:
             return None
 
-        # Flip frame horizontally (mirror effect)
-        frame = cv2.flip(frame, 1)
-
         # Get current display state (thread-safe)
         current_state = self.display_state.get_current_state()
+        state_sig = self._state_getter(current_state)
+
+        # Push any batched camera-control changes to the settings overlay
+        if self.camera_controls:
+            self.camera_controls.flush_overlay()
+        settings_visible = bool(
+            self.settings_overlay and self.settings_overlay.is_visible()
+        )
+
+        # The frame source hands out the same frame object until a new
+        # one arrives; with unchanged state the window already shows this
+        # exact composite, so skip overlay + imshow. The settings overlay
+        # (and the frame after it hides) always re-renders.
+        unchanged = (
+            frame is self._last_raw
+            and state_sig == self._last_sig
+            and not settings_visible
+            and not self._settings_shown
+        )
+        if not unchanged:
+            self._render_and_show(frame, current_state)
+            self._last_raw = frame
+            self._last_sig = state_sig
+            self._settings_shown = settings_visible
+        else:
+            # Nothing new to show yet; don't spin on the same frame
+            time.sleep(0.001)
+
+        # Check for keyboard input (non-blocking) and delegate to InputHandler
+        key = self._poll_key() & 0xFF
+        if key != 255:  # Key was pressed
+            if self._handle_key_press(key, current_state):
+                return "quit"
+
+        return None
+
+    def _render_and_show(self, frame, current_state):
+        """Mirror, draw overlays and display one camera frame."""
+        # Flip frame horizontally (mirror effect) into a persistent buffer;
+        # overlays write into the result, so a read-only view won't do
+        buf = self._flip_buf
+        if buf is None or buf.shape != frame.shape or buf.dtype != frame.dtype:
+            buf = self._flip_buf = np.empty_like(frame)
+        if self._sensor_mirrored:
+            # Already mirrored; a straight copy keeps the raw frame untouched
+            np.copyto(buf, frame)
+            frame = buf
+        else:
+            frame = cv2.flip(frame, 1, dst=buf)
 
         # Convert display state to overlay format
         overlay_state = self._convert_state_to_overlay_format(current_state)
 
-        # Render overlay on frame
+        # Render overlay on frame, then the settings overlay
         rendered_frame = self.overlay_renderer.draw_overlay(frame, overlay_state)
-
-        # Apply settings overlay if available
         if self.settings_overlay:
             rendered_frame = self.settings_overlay.draw_overlay(rendered_frame)
 
         # Display frame
+        if not self._window_ready:
+            self._create_window()
         cv2.imshow(self.window_name, rendered_frame)
 
-        # Check for keyboard input (non-blocking) and delegate to InputHandler
-        key = cv2.waitKey(1) & 0xFF
-        if key != 255:  # Key was pressed
-            self._handle_key_press(key, current_state)
+    def _create_window(self):
+        """
+        Create the preview window, OpenGL-backed when OpenCV supports it.
 
-        return None  # VideoRenderer no longer returns key events
+        A WINDOW_OPENGL window uploads each frame as a texture instead of
+        converting it on the CPU. OpenCV builds without GL raise here, in
+        which case the default window is used.
+        """
+        try:
+            cv2.namedWindow(self.window_name, cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+        except cv2.error:
+            cv2.namedWindow(self.window_name, cv2.WINDOW_AUTOSIZE)
+        self._window_ready = True
 
     def _convert_state_to_overlay_format(self, state):
         """
@@ -92,49 +200,68 @@ class VideoRenderer:
 
         This bridges the gap between our new state format and the existing
         overlay renderer expectations.
+
+        The same dict is refilled and returned every frame, so the overlay
+        renderer must not keep a reference to it past draw_overlay().
         """
-        overlay_state = {
-            "phase": state.phase,
-            "countdown_active": state.phase == "countdown",
-            "gotcha_active": state.gotcha_active,
-            "countdown_number": state.countdown_number or 0,
-            "qr_url": state.qr_data,
-        }
+        phase, gotcha_active, countdown_number, qr_data = self._state_getter(state)
+        overlay_state = self._overlay_state
+        overlay_state["phase"] = phase
+        overlay_state["countdown_active"] = phase == "countdown"
+        overlay_state["gotcha_active"] = gotcha_active
+        overlay_state["countdown_number"] = countdown_number or 0
+        overlay_state["qr_url"] = qr_data
 
-        # Debug output
-        if state.phase != "idle":
-            print(
-                f"🎨 VideoRenderer: phase={state.phase}, countdown={state.countdown_number}, gotcha={state.gotcha_active}"
+        # Debug output on phase transitions only, not every frame
+        if phase != self._last_logged_phase:
+            self._last_logged_phase = phase
+            self.logger.debug(
+                "🎨 VideoRenderer: phase=%s, countdown=%s, gotcha=%s",
+                phase,
+                countdown_number,
+                gotcha_active,
             )
 
         return overlay_state
 
     def _handle_key_press(self, key, current_state):
-        """Handle keyboard input by delegating to appropriate handlers."""
-        if key == ord("q"):
-            if self.input_handler:
-                self.input_handler.handle_key_input("quit")
-        elif key == ord(" "):  # Spacebar
-            if self.input_handler:
-                self.input_handler.handle_key_input("button")
-        elif key == ord("s"):
+        """
+        Handle keyboard input by delegating to appropriate handlers.
+
+        Returns:
+            bool: True if the InputHandler requested quit
+        """
+        command = self._key_commands.get(key)
+        if command is not None:
             if self.input_handler:
-                self.input_handler.handle_key_input("status")
-        else:
+                return self.input_handler.handle_key_event(command)
+        elif self.camera_controls and self._is_idle_state(current_state):
             # Handle camera control keys (only when idle)
-            if self.camera_controls and self._is_idle_state(current_state):
-                self.camera_controls.handle_key(key)
+            self.camera_controls.handle_key(key)
 
     def _is_idle_state(self, state):
         """Check if system is in idle state (ready for camera controls)."""
-        return (
-            state.phase == "idle"
-            and not state.gotcha_active
-            and not state.qr_data  # No QR being displayed
-        )
+        phase, gotcha_active, _, qr_data = self._state_getter(state)
+        # No QR being displayed
+        return phase == "idle" and not gotcha_active and not qr_data
+
+    def start_capture(self):
+        """Start the background frame source (no-op if already running)."""
+        if self._frame_source is not None:
+            return
+        self._frame_source = ThreadedFrameSource(self.camera_manager).start()
+
+    def stop_capture(self):
+        """Stop the frame source; render_frame goes back to direct capture."""
+        source = self._frame_source
+        if source is None:
+            return
+        source.stop()
+        self._frame_source = None
 
     def cleanup(self):
-        """Clean up OpenCV windows"""
+        """Stop capture and clean up OpenCV windows"""
+        self.stop_capture()
         cv2.destroyAllWindows()
 
     def run_continuous_loop(self):
@@ -144,9 +271,23 @@ class VideoRenderer:
         This can be used for threading or standalone operation.
         """
         print("🎬 VideoRenderer: Starting continuous loop")
+        if self.preview_enabled:
+            self.start_capture()
+        # Pace to a target frame rate: waitKey/pollKey alone either stalls
+        # (some GUI backends) or returns at once and pins a CPU core
+        frame_budget = 1.0 / self.config.get("PREVIEW_FPS", 30)
+        next_deadline = time.perf_counter()
         try:
             while True:
                 key_pressed = self.render_frame()
+                # Fixed deadlines keep the cadence from drifting by the
+                # per-frame overhead; when late, skip the sleep and resync
+                next_deadline += frame_budget
+                slack = next_deadline - time.perf_counter()
+                if slack > 0:
+                    time.sleep(slack)
+                else:
+                    next_deadline = time.perf_counter()
                 if key_pressed == "quit":
                     print("🎬 VideoRenderer: Quit requested")
                     break
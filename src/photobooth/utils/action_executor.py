@@ -34,6 +34,21 @@ class ActionExecutor:
         self.gpio_manager = gpio_manager
         self.photo_manager = photo_manager
 
+        # (action attribute, handler) in execution order. Each handler runs
+        # when getattr(action, attribute, None) is truthy; the coordinated
+        # actions come first, then the legacy individual flags.
+        self._dispatch = (
+            ("countdown_update", self._on_countdown_update),
+            ("smile_action", self._on_smile_action),
+            ("gotcha_action", self._on_gotcha_action),
+            ("play_beep", self._on_play_beep),
+            ("play_shutter", self._on_play_shutter),
+            ("start_video", self._on_start_video),
+            ("stop_video", self._on_stop_video),
+            ("trigger_scare", self._on_trigger_scare),
+            ("capture_photo", self._on_capture_photo),
+        )
+
     def execute_action(
         self, action, frame=None, session_time=None, session_id=None, now=None
     ):
@@ -50,67 +65,61 @@ class ActionExecutor:
         if action is None:
             return
 
-        # Handle coordinated countdown actions
-        if hasattr(action, "countdown_update") and action.countdown_update:
-            self._execute_countdown_update(action.countdown_update)
+        for name, handler in self._dispatch:
+            if getattr(action, name, None):
+                handler(action, frame, session_time, session_id, now)
 
-        # Handle coordinated smile actions
-        if hasattr(action, "smile_action") and action.smile_action:
-            self._execute_smile_action(
-                action.smile_action, frame, session_time, session_id, now
-            )
+    def _on_countdown_update(self, action, frame, session_time, session_id, now):
+        self._execute_countdown_update(action.countdown_update)
 
-        # Handle coordinated gotcha actions
-        if hasattr(action, "gotcha_action") and action.gotcha_action:
-            self._execute_gotcha_action(action.gotcha_action)
+    def _on_smile_action(self, action, frame, session_time, session_id, now):
+        self._execute_smile_action(
+            action.smile_action, frame, session_time, session_id, now
+        )
 
-        # Handle individual audio actions
-        if hasattr(action, "play_beep") and action.play_beep and self.audio_manager:
+    def _on_gotcha_action(self, action, frame, session_time, session_id, now):
+        self._execute_gotcha_action(action.gotcha_action)
+
+    def _on_play_beep(self, action, frame, session_time, session_id, now):
+        if self.audio_manager:
             print("🔊 ActionExecutor: Playing beep")
             self.audio_manager.play_beep()
 
-        if (
-            hasattr(action, "play_shutter")
-            and action.play_shutter
-            and self.audio_manager
-        ):
+    def _on_play_shutter(self, action, frame, session_time, session_id, now):
+        if self.audio_manager:
             print("📸 ActionExecutor: Playing shutter sound")
             self.audio_manager.play_shutter()
 
-        # Handle video actions
-        if hasattr(action, "start_video") and action.start_video and self.video_manager:
+    def _on_start_video(self, action, frame, session_time, session_id, now):
+        if self.video_manager:
             print("🎥 ActionExecutor: Starting video recording")
             if hasattr(action, "session_id") and hasattr(action, "video_dimensions"):
                 self.video_manager.start_recording(
                     action.session_id, session_time or now, action.video_dimensions
                 )
 
-        if hasattr(action, "stop_video") and action.stop_video and self.video_manager:
+    def _on_stop_video(self, action, frame, session_time, session_id, now):
+        if self.video_manager:
             print("🛑 ActionExecutor: Stopping video recording")
             self.video_manager.stop_recording()
 
-        # Handle GPIO actions
-        if (
-            hasattr(action, "trigger_scare")
-            and action.trigger_scare
-            and self.gpio_manager
-        ):
+    def _on_trigger_scare(self, action, frame, session_time, session_id, now):
+        if self.gpio_manager:
             print("💀 ActionExecutor: Triggering scare!")
             self.gpio_manager.trigger_scare()
 
-        # Handle photo actions
-        if (
-            hasattr(action, "capture_photo")
-            and action.capture_photo
-            and self.photo_manager
-            and frame is not None
-        ):
+    def _on_capture_photo(self, action, frame, session_time, session_id, now):
+        if self.photo_manager and frame is not None:
             print("📷 ActionExecutor: Capturing photo")
             self.photo_manager.capture_photo(frame, session_time, session_id, now)
 
     def _execute_countdown_update(self, countdown_data):
         """Execute coordinated countdown actions (beep + display + prop trigger)"""
-        if countdown_data.get("play_beep") and self.audio_manager:
+        # SessionManager sends an update every frame; only number changes beep
+        if not countdown_data.get("play_beep"):
+            return
+
+        if self.audio_manager:
             print(
                 f"🔊 ActionExecutor: Playing countdown beep for {countdown_data.get('number')}"
             )
@@ -127,15 +136,21 @@ class ActionExecutor:
 
     def _execute_smile_action(self, smile_data, frame, session_time, session_id, now):
         """Execute coordinated smile actions (shutter + photo)"""
+        executed = False
         if smile_data.get("play_shutter") and self.audio_manager:
             print("📸 ActionExecutor: Playing shutter sound")
             self.audio_manager.play_shutter()
+            executed = True
 
         if smile_data.get("capture_photo") and self.photo_manager and frame is not None:
             print("📷 ActionExecutor: Capturing photo")
             self.photo_manager.capture_photo(frame, session_time, session_id, now)
+            executed = True
 
-        print("📸 ActionExecutor: Smile action executed")
+        # The smile phase repeats {"show_display": True} every frame; only
+        # report frames that actually did something
+        if executed:
+            print("📸 ActionExecutor: Smile action executed")
 
     def _execute_gotcha_action(self, gotcha_data):
         """Execute coordinated gotcha actions"""
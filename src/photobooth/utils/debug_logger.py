@@ -4,14 +4,14 @@ Centralized debug logging system with categories
 """
 
 import time
-from datetime import datetime
 
 
 class DebugLogger:
     def __init__(self, debug_mode=False, categories=None):
         self.debug_mode = debug_mode
         self.enabled_categories = categories or ["all"]
-        self.start_time = time.time()
+        # Monotonic so elapsed times survive wall-clock (NTP) adjustments
+        self.start_time = time.monotonic()
 
     def log(self, category, message):
         """Log a debug message if the category is enabled."""
@@ -24,8 +24,12 @@ class DebugLogger:
         ):
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        elapsed = time.time() - self.start_time
+        # Only reached for emitted lines; plain integer formatting instead of
+        # building a datetime and running strftime on every message
+        secs, ms = divmod(time.time_ns() // 1_000_000, 1000)
+        tm = time.localtime(secs)
+        timestamp = f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{ms:03d}"
+        elapsed = time.monotonic() - self.start_time
 
         print(f"[{timestamp}] [{elapsed:8.3f}s] [{category.upper():8}] {message}")
 
@@ -57,4 +61,4 @@ class DebugLogger:
 
     def reset_timer(self):
         """Reset the elapsed time timer."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
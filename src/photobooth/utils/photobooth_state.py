@@ -7,6 +7,20 @@ import time
 
 
 class PhotoBoothState:
+    # Fixed attribute set: read by the overlay renderer every frame, and a
+    # typo'd assignment now fails loudly instead of creating a new field
+    __slots__ = (
+        "countdown_active",
+        "count_end_time",
+        "gotcha_end_time",
+        "session_time",
+        "session_id",
+        "countdown_number",
+        "phase",
+        "qr_url",
+        "smile_end_time",
+    )
+
     def __init__(self):
         self.countdown_active = False
         self.count_end_time = 0.0
@@ -3,18 +3,56 @@
 Generates a QR code image for a given URL.
 """
 
-import qrcode
+import functools
+import importlib.util
 
+import cv2
+import numpy as np
+
+# qrcode is only needed once a session reaches its QR phase, so it is
+# imported on first use; find_spec() checks availability without loading it
+QRCODE_AVAILABLE = importlib.util.find_spec("qrcode") is not None
+
+
+def _make_qr_matrix(url):
+    import qrcode
 
-def generate_qr(url, out_path="qr_code.png", size=6):
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_M,
-        box_size=size,
         border=2,
     )
     qr.add_data(url)
     qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    img.save(out_path)
+    # Module grid including the quiet-zone border; True = dark module
+    return qr.get_matrix()
+
+
+@functools.lru_cache(maxsize=32)
+def _qr_array(url, size):
+    # Session URLs recur (every frame of the QR phase, repeat sessions), so
+    # the encode + rasterize runs once per (url, size)
+    cells = np.where(np.asarray(_make_qr_matrix(url), dtype=bool), 0, 255)
+    # Each module becomes a size x size block: the same image PIL's
+    # make_image() produces, without the PIL image or its RGB conversion
+    gray = np.kron(cells.astype(np.uint8), np.ones((size, size), dtype=np.uint8))
+    arr = np.repeat(gray[:, :, None], 3, axis=2)
+    # Shared between callers through the cache; make sure nobody writes to it
+    arr.flags.writeable = False
+    return arr
+
+
+def generate_qr(url, out_path="qr_code.png", size=6):
+    cv2.imwrite(out_path, _qr_array(url, size))
     return out_path
+
+
+def generate_qr_array(url, size=6):
+    """
+    Return the QR code as an (H, W, 3) uint8 array, without touching disk.
+
+    The image is pure black/white, so it is valid as either RGB or BGR and
+    can be pasted straight into an OpenCV frame. The array is read-only and
+    shared through a per-URL cache; callers only copy out of it.
+    """
+    return _qr_array(url, size)
@@ -3,13 +3,12 @@ qr_manager.py
 Handles QR code generation and file management
 """
 
-import qrcode
-import cv2
-import numpy as np
 import os
 import shutil
 import glob
 
+from photobooth.utils.qr_generator import generate_qr_array
+
 
 class QRManager:
     def __init__(self, config, debug_log_func):
@@ -28,21 +27,15 @@ class QRManager:
     def generate_qr_code(self, session_id):
         """Generate QR code for the session."""
         try:
-            self.session_url = f"{self.base_website_url}?key={session_id}"
-
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_M,
-                box_size=6,
-                border=2,
-            )
-            qr.add_data(self.session_url)
-            qr.make(fit=True)
-
-            # Create QR code image
-            qr_pil = qr.make_image(fill_color="black", back_color="white")
-            qr_array = np.array(qr_pil.convert("RGB"))
-            self.qr_img = cv2.cvtColor(qr_array, cv2.COLOR_RGB2BGR)
+            session_url = f"{self.base_website_url}?key={session_id}"
+            if session_url == self.session_url and self.qr_img is not None:
+                # Same session: the QR image is already built
+                return True
+            self.session_url = session_url
+
+            # In-memory array, memoised per URL by the generator; black/white,
+            # so already valid BGR (read-only)
+            self.qr_img = generate_qr_array(self.session_url, size=6)
 
             self.debug_log("timing", f"📱 QR CODE GENERATED: {self.session_url}")
             return True
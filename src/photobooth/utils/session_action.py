@@ -32,6 +32,32 @@ class SessionAction:
     and returns this action object telling main.py exactly what to do.
     """
 
+    # One SessionAction is built per frame; slots keep it small and fast to
+    # create, and make a misspelled action fail loudly instead of being ignored
+    __slots__ = (
+        "start_video",
+        "stop_video",
+        "video_dimensions",
+        "countdown_update",
+        "smile_action",
+        "gotcha_action",
+        "play_beep",
+        "play_shutter",
+        "trigger_scare",
+        "show_countdown",
+        "countdown_number",
+        "show_smile",
+        "show_gotcha",
+        "show_qr",
+        "qr_url",
+        "capture_photo",
+        "move_files",
+        "cleanup_session",
+        "session_complete",
+        "session_id",
+        "session_time",
+    )
+
     def __init__(self):
         # Video actions
         self.start_video = False
@@ -72,7 +98,8 @@ class SessionAction:
 
     def __repr__(self):
         active_actions = []
-        for attr, value in self.__dict__.items():
-            if value and not attr.startswith("_"):
+        for attr in self.__slots__:
+            value = getattr(self, attr)
+            if value:
                 active_actions.append(f"{attr}={value}")
         return f"SessionAction({', '.join(active_actions)})"
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for the UI InputHandler button handling.
+Runs without hardware: session and GPIO managers are simple stand-ins.
+"""
+
+import sys
+import os
+
+# Add the src directory to Python path for import resolution
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, "src")
+sys.path.insert(0, src_path)
+
+from photobooth.ui.input_handler import InputHandler
+
+
+class FakeSessionManager:
+    def __init__(self):
+        self.countdowns = 0
+
+    def is_idle(self):
+        return True
+
+    def start_countdown(self):
+        self.countdowns += 1
+
+
+class FakeGPIOManager:
+    def __init__(self):
+        self.callback = None
+        self.bouncetime_ms = None
+
+    def add_event_detect(self, callback, bouncetime_ms=200):
+        self.callback = callback
+        self.bouncetime_ms = bouncetime_ms
+
+
+def test_gpio_bounce_filter():
+    """Edges inside the bounce window are dropped before the session guard."""
+    print("🧪 Testing GPIO edge bounce filter...")
+    session = FakeSessionManager()
+    gpio = FakeGPIOManager()
+    handler = InputHandler(session, gpio)
+
+    assert gpio.bouncetime_ms == InputHandler.GPIO_BOUNCE_MS
+    assert gpio.callback == handler._on_gpio_button_press
+
+    gpio.callback(17)
+    assert session.countdowns == 1
+
+    # Clear the 2 s session guard so only the edge filter can reject
+    handler.last_button_ns = None
+    gpio.callback(17)
+    assert session.countdowns == 1, "Bounce edge should have been filtered"
+
+    # Pretend the bounce window has passed
+    handler._last_gpio_edge_ns -= handler._gpio_bounce_ns
+    gpio.callback(17)
+    assert session.countdowns == 2
+    print("✅ Bounce edges coalesced, later press accepted")
+
+
+def test_session_guard():
+    """A second press inside button_debounce_seconds is ignored."""
+    print("🧪 Testing session-level button guard...")
+    session = FakeSessionManager()
+    handler = InputHandler(session)
+
+    handler.handle_key_event("button")
+    handler.handle_key_event("button")
+    assert session.countdowns == 1
+
+    handler.last_button_ns -= handler._button_debounce_ns
+    handler.handle_key_event("button")
+    assert session.countdowns == 2
+    print("✅ Session guard blocks repeats, then re-arms")
+
+
+def test_key_dispatch():
+    """Key names map to handlers; only 'quit' asks the caller to exit."""
+    print("🧪 Testing key dispatch...")
+    session = FakeSessionManager()
+    handler = InputHandler(session)
+
+    assert handler.handle_key_event(None) is False
+    assert handler.handle_key_event("") is False
+    assert handler.handle_key_event("unknown") is False
+    assert handler.handle_key_event("button") is False
+    assert session.countdowns == 1
+    assert handler.handle_key_event("quit") is True
+    print("✅ Key dispatch returns quit only for 'quit'")
+
+
+class FakeState:
+    def __init__(self, phase):
+        self.phase = phase
+
+
+class FakePhasedSessionManager(FakeSessionManager):
+    """Tracks a session phase; is_idle() reads it like SessionManager does."""
+
+    def __init__(self, phase="idle"):
+        super().__init__()
+        self.state = FakeState(phase)
+
+    def is_idle(self):
+        return self.state.phase == "idle"
+
+    def start_countdown(self):
+        super().start_countdown()
+        self.state.phase = "countdown"
+
+
+def test_button_only_from_idle():
+    """Button only starts a session from idle; other phases reject it."""
+    print("🧪 Testing button idle gate...")
+    session = FakePhasedSessionManager()
+    handler = InputHandler(session)
+
+    handler.handle_key_event("button")
+    assert session.countdowns == 1
+    assert session.state.phase == "countdown"
+
+    for phase in ("countdown", "smile", "gotcha"):
+        session.state.phase = phase
+        handler.last_button_ns -= handler._button_debounce_ns
+        handler.handle_key_event("button")
+        assert session.countdowns == 1, f"button accepted in {phase}"
+
+    session.state.phase = "idle"
+    handler.last_button_ns -= handler._button_debounce_ns
+    handler.handle_key_event("button")
+    assert session.countdowns == 2
+    print("✅ Button accepted only from idle")
+
+
+if __name__ == "__main__":
+    test_gpio_bounce_filter()
+    test_session_guard()
+    test_key_dispatch()
+    test_button_only_from_idle()
+    print("🎉 InputHandler tests passed")